@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Async Client Benchmark for KV-Cache
+
+Measures server throughput with many concurrent connections. Unlike
+scripts/benchmark.py (KVStore only, single thread), this goes through the
+network stack and the server's event loop.
+
+Each connection runs its own worker that sends `PUT <key> <value>` and
+waits for the reply before sending the next one.
+
+Usage:
+    python scripts/async_client.py                          # 50 connections x 1000 ops
+    python scripts/async_client.py -c 200 -n 5000           # Custom load
+    python scripts/async_client.py --host 1.2.3.4 --port 7171
+
+uvloop is used automatically when it is installed (see requirements.txt).
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+from typing import List, Tuple
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+ALPHABET = string.ascii_letters + string.digits
+
+
+async def worker(
+        host: str,
+        port: int,
+        ops: int,
+        key_size: int,
+        value_size: int,
+) -> Tuple[int, int]:
+    """
+    Run `ops` PUT requests over a single connection.
+
+    Returns:
+        Tuple of (successful_ops, failed_ops)
+    """
+    # Pre-build every request so the loop only does I/O
+    chars = ''.join(random.choices(ALPHABET, k=ops * (key_size + value_size)))
+    requests: List[bytes] = []
+    for i in range(ops):
+        offset = i * (key_size + value_size)
+        key = chars[offset:offset + key_size]
+        value = chars[offset + key_size:offset + key_size + value_size]
+        requests.append(f"PUT {key} {value}\n".encode())
+
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        return 0, ops
+
+    ok = 0
+    try:
+        write, drain, readuntil = writer.write, writer.drain, reader.readuntil
+        for request in requests:
+            write(request)
+            await drain()
+            response = await readuntil(b"\n")
+            if response.startswith(b"OK"):
+                ok += 1
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+    return ok, ops - ok
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Launch all workers concurrently and report aggregate throughput."""
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        worker(args.host, args.port, args.operations, args.key_size, args.value_size)
+        for _ in range(args.connections)
+    ])
+    elapsed = time.perf_counter() - start
+
+    ok = sum(r[0] for r in results)
+    failed = sum(r[1] for r in results)
+
+    print(f"Completed:  {ok:,} ops ({failed:,} failed)")
+    print(f"Time:       {elapsed:.2f} seconds")
+    print(f"Throughput: {ok / elapsed if elapsed > 0 else 0:,.0f} ops/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Concurrent async client benchmark for KV-Cache",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="localhost",
+        help="Server host"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=7171,
+        help="Server port"
+    )
+    parser.add_argument(
+        "--connections", "-c",
+        type=int,
+        default=50,
+        help="Number of concurrent connections"
+    )
+    parser.add_argument(
+        "--operations", "-n",
+        type=int,
+        default=1000,
+        help="Number of PUT operations per connection"
+    )
+    parser.add_argument(
+        "--key-size",
+        type=int,
+        default=16,
+        help="Size of keys"
+    )
+    parser.add_argument(
+        "--value-size",
+        type=int,
+        default=64,
+        help="Size of values"
+    )
+
+    args = parser.parse_args()
+
+    print(f"KV-Cache Async Client Benchmark")
+    print(f"===============================")
+    print(f"Server: {args.host}:{args.port}")
+    print(f"Connections: {args.connections}")
+    print(f"Operations per connection: {args.operations:,}")
+    print(f"Event loop: {'uvloop' if uvloop is not None else 'asyncio'}")
+    print()
+
+    if uvloop is not None:
+        uvloop.install()
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("\nBenchmark interrupted.")
+
+
+if __name__ == "__main__":
+    main()
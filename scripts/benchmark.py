@@ -9,14 +9,23 @@ Usage:
     python scripts/benchmark.py                    # Run all benchmarks
     python scripts/benchmark.py --operations 10000 # Custom operation count
     python scripts/benchmark.py --profile          # Enable cProfile
+    python scripts/benchmark.py --backend lru-dict # Use the C-backed lru-dict LRU
+    python scripts/benchmark.py --backend dict-move # Plain-dict LRU for comparison
+    python scripts/benchmark.py --backend sampled   # Sampled (approximate) LRU policy
 """
 
 import argparse
+import gc
+import shutil
+import signal
+import subprocess
 import time
+import timeit
 import random
 import string
 import statistics
-from typing import List, Callable, Dict, Any
+from contextlib import contextmanager
+from typing import List, Callable, Dict, Any, Optional, Iterator
 import sys
 import os
 
@@ -24,125 +33,432 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.cache.store import KVStore
-from src.cache.eviction import LRUEvictionPolicy
+from src.cache.eviction import LRUEvictionPolicy, SampledLRUEvictionPolicy
 from src.protocol.parser import ProtocolParser
 
+# Optional C-backed LRU (pip install lru-dict)
+try:
+    from lru import LRU
+except ImportError:
+    LRU = None
+
+# Optional NumPy for bulk test-data generation
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional xxHash for --key-hash xxh3 (pip install xxhash)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+BACKENDS = ("python", "dict-move", "lru-dict", "sampled")
+KEY_HASHES = ("builtin", "xxh3")
+
+
+ALPHABET = string.ascii_letters + string.digits
+
 
 def random_string(length: int) -> str:
     """Generate a random alphanumeric string."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return ''.join(random.choices(ALPHABET, k=length))
+
+
+def random_block(count: int, length: int) -> str:
+    """
+    Generate one contiguous buffer holding `count` fixed-width random
+    strings of `length` alphanumeric characters each.
+
+    All characters are drawn in a single bulk call (NumPy when available)
+    and decoded once, rather than per string.
+    """
+    size = max(count, 0) * max(length, 0)
+    if size == 0:
+        return ""
+
+    if np is not None:
+        alphabet = np.frombuffer(ALPHABET.encode(), dtype=np.uint8)
+        idx = np.random.randint(0, len(ALPHABET), size=size, dtype=np.uint8)
+        return alphabet[idx].tobytes().decode("ascii")
+
+    return ''.join(random.choices(ALPHABET, k=size))
+
+
+def random_strings(count: int, length: int) -> List[str]:
+    """
+    Generate `count` random alphanumeric strings of `length` characters.
+
+    The strings are sliced once, up front, out of a single random_block(),
+    so the timed loops only index a prepared list.
+    """
+    if length <= 0:
+        return [""] * max(count, 0)
+
+    block = random_block(count, length)
+    return [block[i:i + length] for i in range(0, len(block), length)]
+
+
+class DictMoveLRU:
+    """
+    LRU policy on a plain dict, for comparison with LRUEvictionPolicy.
+
+    Relies on dict insertion order: a touched key is moved to the end with
+    pop + re-insert, and the LRU key is the first one in iteration order.
+    Only put/get/clear are provided, which is all the benchmark drives.
+    """
+
+    __slots__ = ("max_size", "_cache")
+
+    def __init__(self, max_size: int):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._cache: Dict[Any, Any] = {}
+
+    def get(self, key) -> Optional[Any]:
+        cache = self._cache
+        try:
+            value = cache.pop(key)
+        except KeyError:
+            return None
+        cache[key] = value
+        return value
+
+    def put(self, key, value) -> Optional[Any]:
+        cache = self._cache
+        if key in cache:
+            del cache[key]
+            cache[key] = value
+            return None
+
+        evicted_key = None
+        if len(cache) >= self.max_size:
+            evicted_key = next(iter(cache))
+            del cache[evicted_key]
 
+        cache[key] = value
+        return evicted_key
 
-def measure_time(func: Callable, iterations: int = 1) -> Dict[str, float]:
-    """Measure execution time statistics."""
-    times = []
+    def clear(self) -> None:
+        self._cache.clear()
 
-    for _ in range(iterations):
-        start = time.perf_counter()
-        func()
-        elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
-        times.append(elapsed)
+
+class HashedKey:
+    """
+    A key wrapper whose hash is a precomputed xxh3-64 digest.
+
+    Lets the benchmarks compare the built-in str hash (SipHash) against a
+    cheaper non-cryptographic hash, particularly for large --key-size.
+    """
+
+    __slots__ = ("raw", "_h")
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._h = xxhash.xxh3_64_intdigest(raw.encode())
+
+    def __hash__(self) -> int:
+        return self._h
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, HashedKey):
+            return self._h == other._h and self.raw == other.raw
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __repr__(self) -> str:
+        return f"HashedKey({self.raw!r})"
+
+
+def warm_hashes(strings: List[str]) -> None:
+    """
+    Hash every string once so later dict operations reuse the cached hash.
+
+    CPython stores a str's hash on the object after the first hash() call,
+    so doing this during setup keeps first-time hashing out of timed loops.
+    """
+    for s in strings:
+        hash(s)
+
+
+def measure_time(
+        func: Callable,
+        number: int = 1,
+        repeat: int = 5,
+        setup: Optional[Callable] = None,
+) -> Dict[str, float]:
+    """
+    Measure execution time statistics.
+
+    Runs `func` `number` times per sample and takes `repeat` samples with
+    timeit, so timer overhead stays outside the benchmark's own loop.
+    `setup` (if given) runs untimed before every sample to reset state.
+    Garbage is collected before sampling; timeit keeps the collector
+    disabled while each sample runs.
+
+    All figures are milliseconds for a single call of `func`.
+    """
+    gc.collect()
+    timer = timeit.Timer(func, setup=setup or "pass")
+    samples = timer.repeat(repeat=repeat, number=number)
+    times = [sample / number * 1000 for sample in samples]  # Convert to ms
 
     return {
         "min_ms": min(times),
         "max_ms": max(times),
         "mean_ms": statistics.mean(times),
         "median_ms": statistics.median(times),
-        "total_ms": sum(times),
     }
 
 
+PERF_EVENTS = "cycles,instructions,cache-misses"
+
+# Cache misses per instruction above which a benchmark is labelled memory-bound
+MEM_BOUND_MISS_RATE = 0.02
+
+# CPU time / wall time below which a benchmark is labelled as waiting (I/O, scheduling)
+WAIT_BOUND_CPU_RATIO = 0.8
+
+
+def _parse_perf_stat(output: str) -> Dict[str, float]:
+    """Parse `perf stat -x,` CSV output into {event: count}."""
+    counters = {}
+    for line in output.splitlines():
+        fields = line.split(",")
+        if len(fields) < 3:
+            continue
+        try:
+            counters[fields[2].split(":")[0]] = float(fields[0])
+        except ValueError:
+            continue  # "<not supported>" / "<not counted>"
+    return counters
+
+
+@contextmanager
+def classify_bound() -> Iterator[Dict[str, Any]]:
+    """
+    Classify the enclosed code as compute-bound, memory-bound or waiting.
+
+    When Linux `perf` is available it is attached to this process and the
+    cache-miss rate per instruction decides between [CPU] and [MEM]. Without
+    perf, falls back to CPU time vs wall time, which can only tell [CPU]
+    from [WAIT].
+
+    Yields a dict that is filled in on exit with "bound" and the raw figures.
+    """
+    result: Dict[str, Any] = {}
+    perf = None
+    if shutil.which("perf"):
+        try:
+            perf = subprocess.Popen(
+                ["perf", "stat", "-x,", "-e", PERF_EVENTS, "-p", str(os.getpid())],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            time.sleep(0.1)  # Let perf attach before measuring
+        except OSError:
+            perf = None
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield result
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        result["cpu_ratio"] = cpu / wall if wall > 0 else 1.0
+
+        counters = {}
+        if perf is not None:
+            perf.send_signal(signal.SIGINT)
+            _, err = perf.communicate()
+            counters = _parse_perf_stat(err)
+
+        instructions = counters.get("instructions")
+        if instructions:
+            result["ipc"] = instructions / counters["cycles"] if counters.get("cycles") else 0.0
+            result["miss_rate"] = counters.get("cache-misses", 0.0) / instructions
+            result["bound"] = "MEM" if result["miss_rate"] > MEM_BOUND_MISS_RATE else "CPU"
+        else:
+            result["bound"] = "WAIT" if result["cpu_ratio"] < WAIT_BOUND_CPU_RATIO else "CPU"
+
+
 class Benchmark:
     """Collection of benchmarks for KV-Cache components."""
 
-    def __init__(self, operations: int = 10000, key_size: int = 16, value_size: int = 64):
+    def __init__(
+            self,
+            operations: int = 10000,
+            key_size: int = 16,
+            value_size: int = 64,
+            backend: str = "python",
+            repeat: int = 5,
+            key_hash: str = "builtin",
+            classify: bool = False,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == "lru-dict" and LRU is None:
+            raise RuntimeError("lru-dict backend requested but 'lru' is not installed")
+        if key_hash not in KEY_HASHES:
+            raise ValueError(f"Unknown key hash: {key_hash}")
+        if key_hash == "xxh3" and xxhash is None:
+            raise RuntimeError("xxh3 key hash requested but 'xxhash' is not installed")
+
         self.operations = operations
         self.key_size = key_size
         self.value_size = value_size
+        self.backend = backend
+        self.repeat = repeat
+        self.key_hash = key_hash
+        self.classify = classify
 
         # Pre-generate test data
-        self.keys = [random_string(key_size) for _ in range(operations)]
-        self.values = [random_string(value_size) for _ in range(operations)]
+        self.keys = random_strings(operations, key_size)
+        self.values = random_strings(operations, value_size)
+        self.keys = self._make_keys(self.keys)
+
+        # One store shared by every benchmark, cleared between them
+        self._store = KVStore(max_size=operations * 2)
+
+    def _make_keys(self, raw_keys: List[str]) -> list:
+        """Prepare keys for the timed loops according to --key-hash."""
+        if self.key_hash == "xxh3":
+            return [HashedKey(k) for k in raw_keys]
+        warm_hashes(raw_keys)
+        return raw_keys
+
+    def _reset_store(self, max_size: int) -> KVStore:
+        """Empty the shared store and set its capacity for the next benchmark."""
+        self._store.clear()
+        self._store.max_size = max_size
+        return self._store
 
     def benchmark_put(self) -> Dict[str, Any]:
         """Benchmark PUT operations."""
-        store = KVStore(max_size=self.operations * 2)
+        store = self._reset_store(self.operations * 2)
+        store_put = store.put
+        keys, values = self.keys, self.values
 
         def run():
-            for i in range(self.operations):
-                store.put(self.keys[i], self.values[i])
+            for key, value in zip(keys, values):
+                store_put(key, value)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        stats = measure_time(run, repeat=self.repeat, setup=store.clear)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "PUT"
         stats["count"] = self.operations
         return stats
 
+    def benchmark_put_bulk(self) -> Dict[str, Any]:
+        """Benchmark PUT operations through the put_many() bulk API."""
+        store = self._reset_store(self.operations * 2)
+        keys, values = self.keys, self.values
+
+        def run():
+            store.put_many(keys, values)
+
+        stats = measure_time(run, repeat=self.repeat, setup=store.clear)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
+        stats["operation"] = "PUT (bulk)"
+        stats["count"] = self.operations
+        return stats
+
     def benchmark_get(self) -> Dict[str, Any]:
         """Benchmark GET operations (cache hits)."""
-        store = KVStore(max_size=self.operations * 2)
+        store = self._reset_store(self.operations * 2)
 
         # Pre-populate
         for i in range(self.operations):
             store.put(self.keys[i], self.values[i])
 
+        store_get = store.get
+        keys = self.keys
+
         def run():
-            for i in range(self.operations):
-                store.get(self.keys[i])
+            for key in keys:
+                store_get(key)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        stats = measure_time(run, repeat=self.repeat)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "GET (hit)"
         stats["count"] = self.operations
         return stats
 
+    def benchmark_get_bulk(self) -> Dict[str, Any]:
+        """Benchmark GET operations (cache hits) through the get_many() bulk API."""
+        store = self._reset_store(self.operations * 2)
+        store.put_many(self.keys, self.values)
+        keys = self.keys
+
+        def run():
+            store.get_many(keys)
+
+        stats = measure_time(run, repeat=self.repeat)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
+        stats["operation"] = "GET (bulk)"
+        stats["count"] = self.operations
+        return stats
+
     def benchmark_get_miss(self) -> Dict[str, Any]:
         """Benchmark GET operations (cache misses)."""
-        store = KVStore(max_size=self.operations * 2)
-        miss_keys = [random_string(self.key_size) for _ in range(self.operations)]
+        # The store is empty, so every pre-generated key misses
+        store = self._reset_store(self.operations * 2)
+        miss_keys = self.keys
+
+        store_get = store.get
 
         def run():
             for key in miss_keys:
-                store.get(key)
+                store_get(key)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        stats = measure_time(run, repeat=self.repeat)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "GET (miss)"
         stats["count"] = self.operations
         return stats
 
     def benchmark_delete(self) -> Dict[str, Any]:
         """Benchmark DELETE operations."""
-        store = KVStore(max_size=self.operations * 2)
+        store = self._reset_store(self.operations * 2)
+        store_put, store_delete = store.put, store.delete
+        keys, values = self.keys, self.values
 
-        # Pre-populate
-        for i in range(self.operations):
-            store.put(self.keys[i], self.values[i])
+        def populate():
+            for key, value in zip(keys, values):
+                store_put(key, value)
 
         def run():
-            for i in range(self.operations):
-                store.delete(self.keys[i])
+            for key in keys:
+                store_delete(key)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        stats = measure_time(run, repeat=self.repeat, setup=populate)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "DELETE"
         stats["count"] = self.operations
         return stats
 
     def benchmark_exists(self) -> Dict[str, Any]:
         """Benchmark EXISTS operations."""
-        store = KVStore(max_size=self.operations * 2)
+        store = self._reset_store(self.operations * 2)
 
         # Pre-populate half
         for i in range(self.operations // 2):
             store.put(self.keys[i], self.values[i])
 
+        store_exists = store.exists
+        keys = self.keys
+
         def run():
-            for i in range(self.operations):
-                store.exists(self.keys[i])
+            for key in keys:
+                store_exists(key)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        stats = measure_time(run, repeat=self.repeat)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "EXISTS"
         stats["count"] = self.operations
         return stats
@@ -151,14 +467,22 @@ class Benchmark:
         """Benchmark with LRU eviction active."""
         # Small cache to force eviction
         max_size = self.operations // 10
-        store = KVStore(max_size=max_size)
 
-        def run():
-            for i in range(self.operations):
-                store.put(self.keys[i], self.values[i])
+        if self.backend == "lru-dict":
+            store = LRU(max_size)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+            def run():
+                for i in range(self.operations):
+                    store[self.keys[i]] = self.values[i]
+        else:
+            store = self._reset_store(max_size)
+
+            def run():
+                for i in range(self.operations):
+                    store.put(self.keys[i], self.values[i])
+
+        stats = measure_time(run, repeat=self.repeat, setup=store.clear)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "PUT (with eviction)"
         stats["count"] = self.operations
         stats["cache_size"] = max_size
@@ -167,35 +491,47 @@ class Benchmark:
 
     def benchmark_ttl_put(self) -> Dict[str, Any]:
         """Benchmark PUT with TTL."""
-        store = KVStore(max_size=self.operations * 2)
+        store = self._reset_store(self.operations * 2)
 
         def run():
             for i in range(self.operations):
                 store.put(self.keys[i], self.values[i], ttl=60)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        stats = measure_time(run, repeat=self.repeat, setup=store.clear)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "PUT (with TTL)"
         stats["count"] = self.operations
         return stats
 
     def benchmark_mixed_workload(self) -> Dict[str, Any]:
         """Benchmark mixed PUT/GET workload (50/50)."""
-        store = KVStore(max_size=self.operations * 2)
-
-        # Pre-populate half
-        for i in range(self.operations // 2):
-            store.put(self.keys[i], self.values[i])
+        store = self._reset_store(self.operations * 2)
+        store_put, store_get = store.put, store.get
+        keys, values = self.keys, self.values
+        half = self.operations // 2
+
+        def populate():
+            # Reset to a store with only the first half pre-populated
+            store.clear()
+            for i in range(half):
+                store_put(keys[i], values[i])
+
+        # Precompute the operation stream: even steps PUT keys[i], odd steps
+        # GET keys[i % half]. Pairing them keeps the PUT/GET interleaving
+        # without a modulo or a branch per iteration.
+        put_keys, put_values = keys[0:self.operations:2], values[0:self.operations:2]
+        get_keys = [keys[i % half] for i in range(1, self.operations, 2)]
+        trailing_puts = list(zip(put_keys[len(get_keys):], put_values[len(get_keys):]))
 
         def run():
-            for i in range(self.operations):
-                if i % 2 == 0:
-                    store.put(self.keys[i], self.values[i])
-                else:
-                    store.get(self.keys[i % (self.operations // 2)])
-
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+            for key, value, get_key in zip(put_keys, put_values, get_keys):
+                store_put(key, value)
+                store_get(get_key)
+            for key, value in trailing_puts:
+                store_put(key, value)
+
+        stats = measure_time(run, repeat=self.repeat, setup=populate)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "Mixed (50% PUT, 50% GET)"
         stats["count"] = self.operations
         return stats
@@ -203,17 +539,13 @@ class Benchmark:
     def benchmark_protocol_parse(self) -> Dict[str, Any]:
         """Benchmark protocol parsing."""
         parser = ProtocolParser()
-        commands = [
-            f"PUT {self.keys[i]} {self.values[i]}"
-            for i in range(self.operations)
-        ]
+        commands = list(map("PUT {} {}".format, self.keys, self.values))
 
         def run():
-            for cmd in commands:
-                parser.parse_request(cmd)
+            parser.parse_batch(commands)
 
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        stats = measure_time(run, repeat=self.repeat)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "Protocol Parse"
         stats["count"] = self.operations
         return stats
@@ -221,14 +553,27 @@ class Benchmark:
     def benchmark_lru_policy(self) -> Dict[str, Any]:
         """Benchmark LRU policy directly."""
         max_size = self.operations // 10
-        lru = LRUEvictionPolicy(max_size=max_size)
 
-        def run():
-            for i in range(self.operations):
-                lru.put(self.keys[i], self.values[i])
-
-        stats = measure_time(run)
-        stats["ops_per_second"] = self.operations / (stats["total_ms"] / 1000)
+        if self.backend == "lru-dict":
+            lru = LRU(max_size)
+
+            def run():
+                for i in range(self.operations):
+                    lru[self.keys[i]] = self.values[i]
+        else:
+            if self.backend == "dict-move":
+                lru = DictMoveLRU(max_size=max_size)
+            elif self.backend == "sampled":
+                lru = SampledLRUEvictionPolicy(max_size=max_size)
+            else:
+                lru = LRUEvictionPolicy(max_size=max_size)
+
+            def run():
+                for i in range(self.operations):
+                    lru.put(self.keys[i], self.values[i])
+
+        stats = measure_time(run, repeat=self.repeat, setup=lru.clear)
+        stats["ops_per_second"] = self.operations / (stats["median_ms"] / 1000)
         stats["operation"] = "LRU Policy PUT"
         stats["count"] = self.operations
         return stats
@@ -237,7 +582,9 @@ class Benchmark:
         """Run all benchmarks."""
         benchmarks = [
             ("PUT", self.benchmark_put),
+            ("PUT (bulk)", self.benchmark_put_bulk),
             ("GET (hit)", self.benchmark_get),
+            ("GET (bulk)", self.benchmark_get_bulk),
             ("GET (miss)", self.benchmark_get_miss),
             ("DELETE", self.benchmark_delete),
             ("EXISTS", self.benchmark_exists),
@@ -251,10 +598,19 @@ class Benchmark:
         results = []
         for name, func in benchmarks:
             print(f"Running: {name}...", end=" ", flush=True)
-            result = func()
+            if self.classify:
+                with classify_bound() as bound:
+                    result = func()
+                result.update(bound)
+            else:
+                result = func()
             print(f"{result['ops_per_second']:,.0f} ops/sec")
             results.append(result)
 
+            # Drop this benchmark's data before the next one starts
+            self._store.clear()
+            gc.collect()
+
         return results
 
 
@@ -264,23 +620,30 @@ def print_results(results: List[Dict[str, Any]]):
     print("=" * 70)
     print("                        BENCHMARK RESULTS")
     print("=" * 70)
-    print(f"{'Operation':<30} {'Ops/sec':>12} {'Mean (ms)':>12} {'Total (ms)':>12}")
+    print(f"{'Operation':<30} {'Ops/sec':>12} {'Median (ms)':>12} {'Min (ms)':>12}")
     print("-" * 70)
 
     for r in results:
+        bound = f" [{r['bound']}]" if "bound" in r else ""
         print(f"{r['operation']:<30} {r['ops_per_second']:>12,.0f} "
-              f"{r['mean_ms']:>12.3f} {r['total_ms']:>12.1f}")
+              f"{r['median_ms']:>12.3f} {r['min_ms']:>12.3f}{bound}")
 
     print("=" * 70)
 
-    # Summary
+    if any("bound" in r for r in results):
+        print("[CPU] compute-bound  [MEM] memory-bound (cache misses/instr > "
+              f"{MEM_BOUND_MISS_RATE})  [WAIT] CPU time < {WAIT_BOUND_CPU_RATIO:.0%} of wall time")
+        if not shutil.which("perf"):
+            print("perf not found: classification uses CPU/wall time only and cannot detect [MEM]")
+
+    # Summary: count and median_ms both describe one run of each benchmark
     total_ops = sum(r['count'] for r in results)
-    total_time = sum(r['total_ms'] for r in results)
+    total_time = sum(r['median_ms'] for r in results)
     avg_ops = total_ops / (total_time / 1000)
 
     print()
     print(f"Total operations: {total_ops:,}")
-    print(f"Total time: {total_time / 1000:.2f} seconds")
+    print(f"Total time: {total_time / 1000:.2f} seconds (median run per test)")
     print(f"Average throughput: {avg_ops:,.0f} ops/sec")
 
 
@@ -313,20 +676,58 @@ def main():
         action="store_true",
         help="Enable cProfile profiling"
     )
+    parser.add_argument(
+        "--key-hash",
+        choices=KEY_HASHES,
+        default="builtin",
+        help="Key hashing: built-in str hash, or keys wrapped with a precomputed xxh3-64 hash"
+    )
+    parser.add_argument(
+        "--classify",
+        action="store_true",
+        help="Label each benchmark as compute-bound, memory-bound or waiting (uses perf if available)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed samples per benchmark (stats are taken across samples)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="python",
+        help="LRU implementation: 'python' (LRUEvictionPolicy/KVStore), "
+             "'dict-move' (plain dict pop + re-insert, LRU policy benchmark only), "
+             "'lru-dict' (C extension), "
+             "'sampled' (SampledLRUEvictionPolicy, LRU policy benchmark only)"
+    )
 
     args = parser.parse_args()
 
+    if args.backend == "lru-dict" and LRU is None:
+        parser.error("--backend lru-dict requires the lru-dict package (pip install lru-dict)")
+    if args.key_hash == "xxh3" and xxhash is None:
+        parser.error("--key-hash xxh3 requires the xxhash package (pip install xxhash)")
+
     print(f"KV-Cache Benchmark")
     print(f"==================")
     print(f"Operations per test: {args.operations:,}")
     print(f"Key size: {args.key_size}")
     print(f"Value size: {args.value_size}")
+    print(f"Backend: {args.backend}")
+    print(f"Key hash: {args.key_hash}")
+    print(f"Samples per test: {args.repeat}")
     print()
 
     benchmark = Benchmark(
         operations=args.operations,
         key_size=args.key_size,
         value_size=args.value_size,
+        backend=args.backend,
+        repeat=args.repeat,
+        key_hash=args.key_hash,
+        classify=args.classify,
     )
 
     if args.profile:
@@ -8,6 +8,9 @@ Usage:
     python scripts/client.py                  # Connect to localhost:7171
     python scripts/client.py --host 1.2.3.4   # Connect to specific host
     python scripts/client.py --port 8080      # Connect to specific port
+    python scripts/client.py < commands.txt   # Stream commands from a file
+                                              # (exit ends the stream; help,
+                                              # status and reconnect are skipped)
 
 Commands:
     PUT <key> <value> [ttl]   - Store a key-value pair
@@ -20,8 +23,11 @@ Commands:
 """
 
 import argparse
+import os
+import selectors
 import socket
 import sys
+from typing import List
 
 # Enable command history with arrow keys (works on Unix systems)
 try:
@@ -30,6 +36,9 @@ except ImportError:
     pass  # readline not available on Windows by default
 
 
+RECV_BUFFER_SIZE = 64 * 1024
+
+
 class KVCacheClient:
     """Simple TCP client for KV-Cache."""
 
@@ -39,6 +48,10 @@ class KVCacheClient:
         self.timeout = timeout
         self.socket = None
 
+        # Persistent receive buffer, reused by every recv_into() call
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buf)
+
     def connect(self) -> bool:
         """Connect to the server."""
         try:
@@ -72,12 +85,14 @@ class KVCacheClient:
             self.socket.sendall(command.encode('utf-8'))
 
             # Receive response
-            response = b''
+            response = bytearray()
+            recv_into = self.socket.recv_into
+            view = self._recv_view
             while not response.endswith(b'\n'):
-                chunk = self.socket.recv(4096)
-                if not chunk:
+                n = recv_into(view)
+                if not n:
                     return "ERROR: Connection closed by server"
-                response += chunk
+                response += view[:n]
 
             return response.decode('utf-8').strip()
 
@@ -86,6 +101,57 @@ class KVCacheClient:
         except Exception as e:
             return f"ERROR: {e}"
 
+    def send_batch(self, commands: List[str]) -> List[str]:
+        """
+        Send several commands in one write and collect their responses.
+
+        The server answers pipelined requests in order, so all commands go
+        out in a single sendall() and responses are read until one line per
+        command has arrived. Commands that got no response (timeout, error,
+        or the server closing the connection) get an "ERROR: ..." entry.
+        """
+        if not commands:
+            return []
+        if not self.socket:
+            return ["ERROR: Not connected"] * len(commands)
+
+        expected = len(commands)
+        response = bytearray()
+        error = None
+
+        try:
+            payload = ''.join(
+                command if command.endswith('\n') else command + '\n'
+                for command in commands
+            )
+            self.socket.sendall(payload.encode('utf-8'))
+
+            recv_into = self.socket.recv_into
+            view = self._recv_view
+            lines = 0
+            while lines < expected:
+                n = recv_into(view)
+                if not n:
+                    error = "ERROR: Connection closed by server"
+                    break
+                start = len(response)
+                response += view[:n]
+                lines += response.count(b'\n', start)
+
+        except socket.timeout:
+            error = "ERROR: Request timed out"
+        except Exception as e:
+            error = f"ERROR: {e}"
+
+        replies = [
+            line.decode('utf-8').strip()
+            for line in bytes(response).split(b'\n')[:expected]
+            if line
+        ]
+        if len(replies) < expected:
+            replies += [error or "ERROR: No response"] * (expected - len(replies))
+        return replies
+
     def __enter__(self):
         self.connect()
         return self
@@ -94,6 +160,105 @@ class KVCacheClient:
         self.disconnect()
 
 
+def run_piped(client: KVCacheClient) -> None:
+    """
+    Stream commands from non-interactive stdin (e.g. a redirected file).
+
+    stdin and the socket are multiplexed with a selector, so input lines are
+    forwarded as soon as they are read (many per write) while responses are
+    printed as they arrive, instead of one blocking round-trip per line.
+    Input stops at EOF or after a QUIT/exit command. The interactive-only
+    commands help, status and reconnect are skipped, never forwarded.
+    """
+    sock = client.socket
+    stdin_fd = sys.stdin.fileno()
+    sock.setblocking(False)
+
+    sel = selectors.DefaultSelector()
+    sel.register(sock, selectors.EVENT_READ, "socket")
+    try:
+        sel.register(stdin_fd, selectors.EVENT_READ, "stdin")
+        stdin_polled = True
+    except (PermissionError, ValueError):
+        # Regular files can't be polled (epoll) but are always readable
+        stdin_polled = False
+
+    pending = 0
+    stdin_open = True
+    inbuf = bytearray()
+    outbuf = bytearray()
+    respbuf = bytearray()
+
+    def read_stdin() -> None:
+        nonlocal pending, stdin_open
+        data = os.read(stdin_fd, 65536)
+        if data:
+            inbuf.extend(data)
+            *lines, rest = inbuf.split(b"\n")
+            inbuf[:] = rest
+        else:
+            lines = [bytes(inbuf)]
+            inbuf.clear()
+            stdin_open = False
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            lower = line.lower()
+            if lower in (b"exit", b"quit"):
+                # Server closes the connection without replying
+                outbuf.extend(b"QUIT\n")
+                stdin_open = False
+                break
+            if lower in (b"help", b"status", b"reconnect"):
+                continue
+            outbuf.extend(line + b"\n")
+            pending += 1
+
+        if not stdin_open and stdin_polled:
+            sel.unregister(stdin_fd)
+
+    try:
+        while stdin_open or pending or outbuf:
+            if stdin_open and not stdin_polled and len(outbuf) < 65536:
+                read_stdin()
+
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if outbuf else 0)
+            sel.modify(sock, events, "socket")
+
+            busy = stdin_open and not stdin_polled and len(outbuf) < 65536
+            ready = sel.select(timeout=0 if busy else client.timeout)
+            if not ready and not busy:
+                print("ERROR: Request timed out")
+                break
+
+            for key, mask in ready:
+                if key.data == "stdin":
+                    read_stdin()
+                    continue
+
+                if mask & selectors.EVENT_WRITE and outbuf:
+                    sent = sock.send(outbuf)
+                    del outbuf[:sent]
+
+                if mask & selectors.EVENT_READ:
+                    data = sock.recv(65536)
+                    if not data:
+                        if pending:
+                            print("ERROR: Connection closed by server")
+                        return
+                    respbuf.extend(data)
+                    *lines, rest = respbuf.split(b"\n")
+                    respbuf[:] = rest
+                    for line in lines:
+                        print(line.decode("utf-8").strip())
+                    pending -= len(lines)
+    finally:
+        sel.close()
+        sock.settimeout(client.timeout)
+
+
 def print_help():
     """Print help message."""
     print("""
@@ -158,6 +323,16 @@ def main():
         print(f"  Try: python -m src.server --port {args.port}")
         sys.exit(1)
 
+    # Non-interactive stdin: stream the input instead of running the REPL
+    if sys.platform != "win32" and not sys.stdin.isatty():
+        try:
+            run_piped(client)
+        except KeyboardInterrupt:
+            print("\n\nInterrupted. Goodbye!")
+        finally:
+            client.disconnect()
+        return
+
     print("Connected! Type 'help' for commands.\n")
 
     try:
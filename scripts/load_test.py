@@ -10,6 +10,11 @@ Usage:
     python scripts/load_test.py --host 1.2.3.4 --port 7171         # Remote server
     python scripts/load_test.py --connections 100 --requests 1000  # Custom load
     python scripts/load_test.py --output results.json              # Save results
+    python scripts/load_test.py --connections 400 --processes 4    # Multi-core load
+    python scripts/load_test.py -c 10 --concurrency-per-connection 10  # 100 clients, 10 sockets
+
+uvloop is used as the event loop when installed (pip install -e .[perf]).
+Latency stats come from a fixed-size HDR histogram when hdrhistogram is installed.
 
 Output:
     Prints statistics including throughput, latency percentiles, and error rates.
@@ -18,23 +23,70 @@ Output:
 
 import argparse
 import asyncio
+import base64
 import json
+import os
 import random
-import string
+import socket
 import time
 import statistics
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from array import array
+from itertools import accumulate, compress
+from typing import Deque, List, Optional, Sequence, Tuple
 from datetime import datetime
 
+# Optional NumPy for fast statistics over large latency samples
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-@dataclass
-class RequestResult:
-    """Result of a single request."""
-    operation: str
-    success: bool
-    latency_ms: float
-    error: Optional[str] = None
+# Optional HDR histogram: fixed-size latency summary instead of raw samples
+try:
+    from hdrh.histogram import HdrHistogram
+except ImportError:
+    HdrHistogram = None
+
+# Optional orjson for C-implemented JSON output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional uvloop for a faster event loop (Unix only)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Per-request outcome codes, stored one byte per request in array('b')
+OP_PUT_OK = 0
+OP_PUT_FAIL = 1
+OP_GET_HIT = 2
+OP_GET_MISS = 3
+OP_GET_FAIL = 4
+OP_CONN_FAIL = 5
+NUM_OP_CODES = 6
+
+SUCCESS_CODES = (OP_PUT_OK, OP_GET_HIT, OP_GET_MISS)
+
+# bytes.translate() table turning an outcome array into a 0/1 success mask
+SUCCESS_MASK = bytes(code in SUCCESS_CODES for code in range(256))
+
+# HDR histogram range (microseconds) and precision: 1us..60s, 3 significant digits
+HDR_MIN_US = 1
+HDR_MAX_US = 60_000_000
+HDR_SIGNIFICANT_FIGURES = 3
+
+# Bytes requested per socket read when collecting responses
+RECV_BUFFER_SIZE = 64 * 1024
+
+# Outcome recorded for a scripted operation that failed or never completed
+FAILURE_CODE = {"PUT": OP_PUT_FAIL, "GET": OP_GET_FAIL}
 
 
 @dataclass
@@ -80,22 +132,56 @@ class LoadTestResults:
     # Error rate
     error_rate: float = 0.0
 
-    # Raw latencies for percentile calculation
-    latencies: List[float] = field(default_factory=list)
+    # Raw latencies (successful requests only) for percentile calculation
+    latencies: Sequence[float] = field(default_factory=list)
+
+    # Latency histogram in microseconds (used instead of latencies when hdrh is installed)
+    latency_histogram: Optional["HdrHistogram"] = field(default=None, repr=False)
 
     def calculate_stats(self):
-        """Calculate statistics from raw latencies."""
+        """Calculate statistics from raw latencies or the latency histogram."""
         # Always calculate error rate, even if no successful requests
         self.error_rate = (
             self.failed_requests / self.total_requests * 100
             if self.total_requests > 0 else 0
         )
 
-        if not self.latencies:
+        hist = self.latency_histogram
+        if hist is not None:
+            if hist.get_total_count() == 0:
+                return
+            self.latency_min = hist.get_min_value() / 1000
+            self.latency_max = hist.get_max_value() / 1000
+            self.latency_mean = hist.get_mean_value() / 1000
+            self.latency_median = hist.get_value_at_percentile(50) / 1000
+            self.latency_p95 = hist.get_value_at_percentile(95) / 1000
+            self.latency_p99 = hist.get_value_at_percentile(99) / 1000
+            self.latency_stddev = hist.get_stddev() / 1000
+            return
+
+        n = len(self.latencies)
+        if n == 0:
+            return
+
+        p95_idx = min(int(n * 0.95), n - 1)
+        p99_idx = min(int(n * 0.99), n - 1)
+
+        if np is not None:
+            # Vectorized reductions, and O(n) selection instead of a full sort
+            a = np.asarray(self.latencies, dtype=np.float64)
+            part = np.partition(a, [p95_idx, p99_idx])
+
+            self.latency_min = float(a.min())
+            self.latency_max = float(a.max())
+            self.latency_mean = float(a.mean())
+            self.latency_median = float(np.median(a))
+            self.latency_p95 = float(part[p95_idx])
+            self.latency_p99 = float(part[p99_idx])
+            if n > 1:
+                self.latency_stddev = float(a.std(ddof=1))
             return
 
         sorted_latencies = sorted(self.latencies)
-        n = len(sorted_latencies)
 
         self.latency_min = sorted_latencies[0]
         self.latency_max = sorted_latencies[-1]
@@ -103,8 +189,6 @@ class LoadTestResults:
         self.latency_median = statistics.median(sorted_latencies)
 
         # Percentiles
-        p95_idx = min(int(n * 0.95), n - 1)
-        p99_idx = min(int(n * 0.99), n - 1)
         self.latency_p95 = sorted_latencies[p95_idx]
         self.latency_p99 = sorted_latencies[p99_idx]
 
@@ -113,9 +197,13 @@ class LoadTestResults:
 
     def to_dict(self) -> dict:
         """Convert to dictionary (excluding raw latencies for JSON output)."""
-        d = asdict(self)
-        del d['latencies']  # Don't include raw data in JSON
-        return d
+        # Built from the fields directly: asdict() would deep-copy the raw
+        # latency data only for it to be dropped
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ('latencies', 'latency_histogram')
+        }
 
 
 class LoadTester:
@@ -132,6 +220,10 @@ class LoadTester:
             value_size: int = 64,
             ttl: int = 0,
             timeout: float = 5.0,
+            pipeline: int = 32,
+            max_concurrent_connects: int = 100,
+            processes: int = 1,
+            concurrency_per_connection: int = 1,
     ):
         self.host = host
         self.port = port
@@ -142,132 +234,236 @@ class LoadTester:
         self.value_size = value_size
         self.ttl = ttl
         self.timeout = timeout
+        self.pipeline = max(1, pipeline)
+        self.max_concurrent_connects = max(1, max_concurrent_connects)
+        self.processes = max(1, min(processes, connections))
+        self.concurrency_per_connection = max(1, concurrency_per_connection)
+
+    def _random_text(self, count: int, width: int) -> bytes:
+        """
+        Generate `count` * `width` random URL-safe base64 bytes at once.
+
+        One os.urandom() call plus a C-level base64 encode replaces a
+        per-string random.choices() loop; callers slice fixed-width fields
+        out of the result.
+        """
+        size = count * width
+        encoded = base64.urlsafe_b64encode(os.urandom(size * 3 // 4 + 3))
+        return encoded[:size]
+
+    def _build_script(self) -> List[Tuple[str, bytes]]:
+        """
+        Pre-generate one connection's operations as (operation, framed request).
+
+        Generated up front so the pipelined writer never waits on the RNG.
+        Requests are newline-terminated bytes, ready to write as-is.
+        GETs target a key PUT earlier in the same script 80% of the time
+        (those PUTs are sent first on the same connection), otherwise a
+        random (likely non-existent) key. Key sampling is deliberately
+        per-connection, so clients share no state.
+        """
+        script = []
+        local_keys = []
+
+        # Each operation gets its own fixed-width slice: PUT uses
+        # key + value, GET of an unknown key uses just the key part
+        key_size, value_size = self.key_size, self.value_size
+        stride = key_size + value_size
+        n = self.requests_per_connection
+        text = self._random_text(n, stride)
+
+        # Draw every per-request coin flip up front as 0/1 byte masks:
+        # is_put decides the operation, reuse the 80% known-key choice for GETs
+        rnd = random.Random()
+        if np is not None:
+            draws = np.random.default_rng().random((2, n))
+            is_put = (draws[0] < self.put_ratio).tobytes()
+            reuse = (draws[1] < 0.8).tobytes()
+        else:
+            rand, put_ratio = rnd.random, self.put_ratio
+            is_put = bytes([rand() < put_ratio for _ in range(n)])
+            reuse = bytes([rand() < 0.8 for _ in range(n)])
+
+        # Locals keep attribute lookups out of the loop
+        pick = rnd.choice
+        ttl_suffix = b" %d" % self.ttl if self.ttl > 0 else b""
+        add_script, add_key = script.append, local_keys.append
+
+        for offset, put, known in zip(range(0, n * stride, stride), is_put, reuse):
+            if put:
+                key = text[offset:offset + key_size]
+                value = text[offset + key_size:offset + stride]
+                add_key(key)
+                add_script(("PUT", b"PUT %b %b%b\n" % (key, value, ttl_suffix)))
+            else:
+                if local_keys and known:
+                    # 80% chance to get a key we PUT
+                    key = pick(local_keys)
+                else:
+                    # 20% chance to get a random (likely non-existent) key
+                    key = text[offset:offset + key_size]
 
-        # Track keys that have been PUT for realistic GET operations
-        self.known_keys: List[str] = []
-        self.known_keys_lock = asyncio.Lock()
-
-        # Results
-        self.results: List[RequestResult] = []
-        self.results_lock = asyncio.Lock()
+                add_script(("GET", b"GET %b\n" % key))
 
-    def _random_string(self, length: int) -> str:
-        """Generate a random alphanumeric string."""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return script
 
-    async def _send_command(
+    async def _write_commands(
             self,
-            reader: asyncio.StreamReader,
             writer: asyncio.StreamWriter,
-            command: str
-    ) -> tuple:
-        """Send a command and measure latency."""
-        start_time = time.perf_counter()
+            script: List[Tuple[str, bytes]],
+            pending: Deque[Tuple[str, float]],
+            window: asyncio.Semaphore,
+    ) -> None:
+        """
+        Send the script back-to-back, keeping at most `pipeline` requests in flight.
+
+        Every free window slot is filled at once and the batch goes out with
+        a single write() + drain(), rather than one write per request. The
+        frames are joined into one buffer up front, so each batch is just a
+        memoryview slice of it: no per-batch list, join or copy.
+        """
+        payload = memoryview(b"".join([frame for _, frame in script]))
+        ends = [0, *accumulate(len(frame) for _, frame in script)]
+
+        acquire, locked = window.acquire, window.locked
+        write, drain, now = writer.write, writer.drain, time.perf_counter
+        extend = pending.extend
+
+        i, n = 0, len(script)
+        while i < n:
+            # Wait for at least one free slot, then claim any others that are free
+            await acquire()
+            end = i + 1
+            while end < n and not locked():
+                await acquire()  # Returns immediately when not locked
+                end += 1
+
+            start_time = now()
+            extend((operation, start_time) for operation, _ in script[i:end])
+            write(payload[ends[i]:ends[end]])
+            await drain()
+            i = end
+
+    async def _read_responses(
+            self,
+            reader: asyncio.StreamReader,
+            script: List[Tuple[str, bytes]],
+            pending: Deque[Tuple[str, float]],
+            window: asyncio.Semaphore,
+            latencies: "array[float]",
+            outcomes: "array[int]",
+    ) -> int:
+        """
+        Match each response line to the oldest in-flight request.
+
+        Responses are read in chunks of up to RECV_BUFFER_SIZE bytes and
+        split into lines in C, so there is one read (and one timeout) per
+        chunk rather than a readline() coroutine per response. Every
+        response in a chunk shares that chunk's receive timestamp.
+
+        Latency and outcome code for request i are written to latencies[i]
+        and outcomes[i].
+
+        Returns:
+            Number of requests answered (stops early if the stream fails)
+        """
+        # Bind hot-loop lookups to locals
+        read, wait_for, now = reader.read, asyncio.wait_for, time.perf_counter
+        popleft, release, timeout = pending.popleft, window.release, self.timeout
+
+        i, n = 0, len(script)
+        partial = b""
+        while i < n:
+            try:
+                chunk = await wait_for(read(RECV_BUFFER_SIZE), timeout=timeout)
+            except Exception:
+                chunk = b""
+
+            if not chunk:
+                # Timeout, error or connection closed: stream is no longer usable
+                if not pending:
+                    return i
+                operation, start_time = popleft()
+                latencies[i] = (now() - start_time) * 1000
+                outcomes[i] = FAILURE_CODE[operation]
+                release()
+                return i + 1
+
+            received = now()
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop()
+
+            for response in lines:
+                operation, start_time = popleft()
+                latencies[i] = (received - start_time) * 1000
+                if operation == "PUT":
+                    outcomes[i] = OP_PUT_OK if response.startswith(b"OK") else OP_PUT_FAIL
+                else:
+                    outcomes[i] = OP_GET_HIT if response.startswith(b"OK ") else OP_GET_MISS
+                release()
+                i += 1
+
+        return n
+
+    async def _client_task(self, client_id: int) -> Tuple["array[float]", "array[int]"]:
+        """
+        Run one connection's workload, pipelining up to `pipeline` requests
+        per virtual client.
+
+        With concurrency_per_connection > 1, that many virtual clients share
+        the socket: their scripts are interleaved round-robin, and responses
+        are matched back in FIFO order like any other pipelined request.
+
+        Returns:
+            Tuple of (latencies_ms, outcome_codes), one slot per request
+        """
+        clients = self.concurrency_per_connection
+        if clients == 1:
+            script = self._build_script()
+        else:
+            scripts = [self._build_script() for _ in range(clients)]
+            script = [entry for group in zip(*scripts) for entry in group]
+        n = len(script)
+        latencies = array('d', bytes(8 * n))
+        outcomes = array('b', bytes(n))
 
         try:
-            writer.write(f"{command}\n".encode())
-            await writer.drain()
-
-            response = await asyncio.wait_for(
-                reader.readline(),
-                timeout=self.timeout
-            )
-
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            response_str = response.decode().strip()
-
-            return True, response_str, elapsed_ms
-
-        except asyncio.TimeoutError:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            return False, "TIMEOUT", elapsed_ms
+            async with self._connect_gate:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port),
+                    timeout=self.timeout
+                )
+        except Exception:
+            # Connection failed - record failures for all requests
+            return latencies, array('b', [OP_CONN_FAIL]) * n
 
-        except Exception as e:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            return False, str(e), elapsed_ms
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            # Send each batch immediately; buffer sizes are left to kernel
+            # autotuning, as on the server
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
-    async def _client_task(self, client_id: int) -> List[RequestResult]:
-        """Run a single client's workload."""
-        results = []
+        pending: Deque[Tuple[str, float]] = deque()
+        window = asyncio.Semaphore(self.pipeline * clients)
 
         try:
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
-                timeout=self.timeout
+            write_task = asyncio.ensure_future(
+                self._write_commands(writer, script, pending, window)
+            )
+            answered = await self._read_responses(
+                reader, script, pending, window, latencies, outcomes
             )
-        except Exception as e:
-            # Connection failed - record failures for all requests
-            for _ in range(self.requests_per_connection):
-                results.append(RequestResult(
-                    operation="CONNECT",
-                    success=False,
-                    latency_ms=0,
-                    error=str(e)
-                ))
-            return results
 
-        try:
-            local_keys = []
-
-            for _ in range(self.requests_per_connection):
-                # Decide operation based on ratio
-                if random.random() < self.put_ratio:
-                    # PUT operation
-                    key = self._random_string(self.key_size)
-                    value = self._random_string(self.value_size)
-
-                    if self.ttl > 0:
-                        command = f"PUT {key} {value} {self.ttl}"
-                    else:
-                        command = f"PUT {key} {value}"
-
-                    success, response, latency = await self._send_command(
-                        reader, writer, command
-                    )
-
-                    if success and response.startswith("OK"):
-                        local_keys.append(key)
-                        results.append(RequestResult(
-                            operation="PUT",
-                            success=True,
-                            latency_ms=latency
-                        ))
-                    else:
-                        results.append(RequestResult(
-                            operation="PUT",
-                            success=False,
-                            latency_ms=latency,
-                            error=response
-                        ))
-                else:
-                    # GET operation
-                    # Try to get a known key for realistic testing
-                    if local_keys and random.random() < 0.8:
-                        # 80% chance to get a key we PUT
-                        key = random.choice(local_keys)
-                    else:
-                        # 20% chance to get a random (likely non-existent) key
-                        key = self._random_string(self.key_size)
-
-                    command = f"GET {key}"
-                    success, response, latency = await self._send_command(
-                        reader, writer, command
-                    )
-
-                    if success:
-                        is_hit = response.startswith("OK ")
-                        results.append(RequestResult(
-                            operation="GET_HIT" if is_hit else "GET_MISS",
-                            success=True,
-                            latency_ms=latency
-                        ))
-                    else:
-                        results.append(RequestResult(
-                            operation="GET",
-                            success=False,
-                            latency_ms=latency,
-                            error=response
-                        ))
+            if answered < n:
+                write_task.cancel()
+            try:
+                await write_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+            # Anything never answered (or never sent) counts as failed
+            for i in range(answered, n):
+                outcomes[i] = FAILURE_CODE[script[i][0]]
 
             # Send QUIT
             try:
@@ -283,7 +479,70 @@ class LoadTester:
             except Exception:
                 pass
 
-        return results
+        return latencies, outcomes
+
+    async def _client_task_into(self, client_id: int, slot: int, out: list) -> None:
+        """
+        Run one client and store its results in out[slot].
+
+        With hdrh installed the latency array is folded into an encoded
+        histogram right away, so only fixed-size summaries are kept.
+        """
+        latencies, outcomes = await self._client_task(client_id)
+        if HdrHistogram is not None:
+            latencies = self._encode_histogram(latencies, outcomes)
+        out[slot] = latencies, outcomes
+
+    @staticmethod
+    def _encode_histogram(latencies: "array[float]", outcomes: "array[int]") -> bytes:
+        """Record successful latencies (ms) into an HDR histogram (us) and encode it."""
+        hist = HdrHistogram(HDR_MIN_US, HDR_MAX_US, HDR_SIGNIFICANT_FIGURES)
+        record = hist.record_value
+
+        if np is not None:
+            # One record call per distinct microsecond value, not per request
+            lat = np.frombuffer(latencies, dtype=np.float64)
+            ops = np.frombuffer(outcomes, dtype=np.int8)
+            us = np.maximum((lat[np.isin(ops, SUCCESS_CODES)] * 1000).astype(np.int64), HDR_MIN_US)
+            values, counts = np.unique(us, return_counts=True)
+            for value, count in zip(values.tolist(), counts.tolist()):
+                record(value, count)
+        else:
+            for latency in compress(latencies, outcomes.tobytes().translate(SUCCESS_MASK)):
+                record(max(HDR_MIN_US, int(latency * 1000)))
+        return hist.encode()
+
+    async def _run_clients(
+            self, client_ids: Sequence[int]
+    ) -> List[Tuple["array[float]", "array[int]"]]:
+        """Run the given clients concurrently in this event loop."""
+        # Bound how many connections may be mid-handshake at once
+        self._connect_gate = asyncio.Semaphore(self.max_concurrent_connects)
+
+        # Each client writes its arrays into its own slot
+        out = [None] * len(client_ids)
+        if hasattr(asyncio, "TaskGroup"):  # Python 3.11+
+            async with asyncio.TaskGroup() as tg:
+                for slot, client_id in enumerate(client_ids):
+                    tg.create_task(self._client_task_into(client_id, slot, out))
+        else:
+            await asyncio.gather(*(
+                self._client_task_into(client_id, slot, out)
+                for slot, client_id in enumerate(client_ids)
+            ))
+        return out
+
+    async def _run_in_processes(self) -> List[Tuple["array[float]", "array[int]"]]:
+        """Split the clients across worker processes, one event loop each."""
+        loop = asyncio.get_running_loop()
+        shards = [range(i, self.connections, self.processes)
+                  for i in range(self.processes)]
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(pool, _run_worker, self, shard)
+                for shard in shards
+            ))
+        return [result for part in parts for result in part]
 
     async def run(self) -> LoadTestResults:
         """Run the load test."""
@@ -292,20 +551,21 @@ class LoadTester:
 
         print(f"\nRunning load test against {self.host}:{self.port}")
         print(f"Connections: {self.connections}")
-        print(f"Requests per connection: {self.requests_per_connection}")
-        print(f"Total requests: {self.connections * self.requests_per_connection}")
+        print(f"Virtual clients per connection: {self.concurrency_per_connection}")
+        print(f"Requests per client: {self.requests_per_connection}")
+        print(f"Total requests: {self.connections * self.concurrency_per_connection * self.requests_per_connection}")
         print(f"PUT/GET ratio: {self.put_ratio:.0%}/{1 - self.put_ratio:.0%}")
+        print(f"Pipeline depth: {self.pipeline}")
+        print(f"Event loop: {type(asyncio.get_running_loop()).__module__.split('.')[0]}")
+        print(f"Processes: {self.processes}")
         print()
 
-        # Run all clients concurrently
-        tasks = [
-            self._client_task(i)
-            for i in range(self.connections)
-        ]
-
         # Show progress
         print("Running", end="", flush=True)
-        all_results = await asyncio.gather(*tasks)
+        if self.processes > 1:
+            all_results = await self._run_in_processes()
+        else:
+            all_results = await self._run_clients(range(self.connections))
         print(" Done!\n")
 
         end_perf = time.perf_counter()
@@ -317,35 +577,24 @@ class LoadTester:
             host=self.host,
             port=self.port,
             connections=self.connections,
-            requests_per_connection=self.requests_per_connection,
+            requests_per_connection=self.requests_per_connection * self.concurrency_per_connection,
             put_ratio=self.put_ratio,
             start_time=start_time.isoformat(),
             end_time=end_time.isoformat(),
             total_duration_seconds=total_duration,
         )
 
-        for client_results in all_results:
-            for r in client_results:
-                results.total_requests += 1
+        counts, results.latencies, results.latency_histogram = self._aggregate(all_results)
 
-                if r.success:
-                    results.successful_requests += 1
-                    results.latencies.append(r.latency_ms)
-                else:
-                    results.failed_requests += 1
-
-                if r.operation == "PUT":
-                    results.put_count += 1
-                    if r.success:
-                        results.put_success += 1
-                elif r.operation in ("GET", "GET_HIT", "GET_MISS"):
-                    results.get_count += 1
-                    if r.success:
-                        results.get_success += 1
-                        if r.operation == "GET_HIT":
-                            results.cache_hits += 1
-                        elif r.operation == "GET_MISS":
-                            results.cache_misses += 1
+        results.total_requests = sum(counts)
+        results.successful_requests = sum(counts[c] for c in SUCCESS_CODES)
+        results.failed_requests = results.total_requests - results.successful_requests
+        results.put_success = counts[OP_PUT_OK]
+        results.put_count = counts[OP_PUT_OK] + counts[OP_PUT_FAIL]
+        results.cache_hits = counts[OP_GET_HIT]
+        results.cache_misses = counts[OP_GET_MISS]
+        results.get_success = counts[OP_GET_HIT] + counts[OP_GET_MISS]
+        results.get_count = results.get_success + counts[OP_GET_FAIL]
 
         # Calculate derived stats
         results.calculate_stats()
@@ -356,6 +605,41 @@ class LoadTester:
 
         return results
 
+    @staticmethod
+    def _aggregate(
+            all_results: List[Tuple[object, "array[int]"]]
+    ) -> Tuple[List[int], Sequence[float], Optional["HdrHistogram"]]:
+        """
+        Combine per-client results into outcome counts and latencies.
+
+        Returns:
+            Tuple of (count per outcome code, latencies of successful requests,
+            merged histogram). With hdrh installed the latencies are empty and
+            the histogram holds them; otherwise the histogram is None.
+        """
+        if HdrHistogram is not None:
+            hist = HdrHistogram(HDR_MIN_US, HDR_MAX_US, HDR_SIGNIFICANT_FIGURES)
+            counts = [0] * NUM_OP_CODES
+            for encoded, ops in all_results:
+                hist.decode_and_add(encoded)
+                for code in range(NUM_OP_CODES):
+                    counts[code] += ops.count(code)
+            return counts, array('d'), hist
+
+        if np is not None and all_results:
+            lat = np.concatenate([np.frombuffer(r[0], dtype=np.float64) for r in all_results])
+            ops = np.concatenate([np.frombuffer(r[1], dtype=np.int8) for r in all_results])
+            counts = np.bincount(ops, minlength=NUM_OP_CODES).tolist()
+            return counts, lat[np.isin(ops, SUCCESS_CODES)], None
+
+        counts = [0] * NUM_OP_CODES
+        latencies = array('d')
+        for lat, ops in all_results:
+            for code in range(NUM_OP_CODES):
+                counts[code] += ops.count(code)
+            latencies.extend(compress(lat, ops.tobytes().translate(SUCCESS_MASK)))
+        return counts, latencies, None
+
     @staticmethod
     def print_results(results: LoadTestResults):
         """Print results in a nice format."""
@@ -435,6 +719,15 @@ class LoadTester:
         print()
 
 
+def _run_worker(
+        tester: LoadTester, client_ids: Sequence[int]
+) -> List[Tuple["array[float]", "array[int]"]]:
+    """Process pool entry point: run a shard of clients in a fresh event loop."""
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(tester._run_clients(client_ids))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Load test the KV-Cache server",
@@ -463,7 +756,7 @@ def main():
         "--requests", "-r",
         type=int,
         default=1000,
-        help="Number of requests per connection"
+        help="Number of requests per client (per connection when -k is 1)"
     )
     parser.add_argument(
         "--ratio",
@@ -495,6 +788,30 @@ def main():
         default=5.0,
         help="Request timeout in seconds"
     )
+    parser.add_argument(
+        "--pipeline", "-p",
+        type=int,
+        default=32,
+        help="Max in-flight requests per connection (1 = strict request/response)"
+    )
+    parser.add_argument(
+        "--max-concurrent-connects",
+        type=int,
+        default=100,
+        help="Max connections opening at the same time per process (limits SYN bursts)"
+    )
+    parser.add_argument(
+        "--processes", "-P",
+        type=int,
+        default=1,
+        help="Worker processes to spread connections over (one event loop each)"
+    )
+    parser.add_argument(
+        "--concurrency-per-connection", "-k",
+        type=int,
+        default=1,
+        help="Virtual clients multiplexed over each connection (in-flight = connections x k x pipeline)"
+    )
     parser.add_argument(
         "--output", "-o",
         type=str,
@@ -515,8 +832,15 @@ def main():
         value_size=args.value_size,
         ttl=args.ttl,
         timeout=args.timeout,
+        pipeline=args.pipeline,
+        max_concurrent_connects=args.max_concurrent_connects,
+        processes=args.processes,
+        concurrency_per_connection=args.concurrency_per_connection,
     )
 
+    if uvloop is not None:
+        uvloop.install()
+
     try:
         results = asyncio.run(tester.run())
     except KeyboardInterrupt:
@@ -549,8 +873,12 @@ def main():
     # Save to file if requested
     if args.output:
         output_data = results.to_dict()
-        with open(args.output, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        if orjson is not None:
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(output_data, f, indent=2)
         print(f"Results saved to: {args.output}")
 
 
@@ -16,6 +16,9 @@ setup(
     version="1.0.0",
     packages=find_packages(),
     python_requires=">=3.10",
+    extras_require={
+        "perf": ['uvloop; platform_system != "Windows"', "orjson", "xxhash"],
+    },
     entry_points={
         "console_scripts": [
             "kv-cache=src.server:main",
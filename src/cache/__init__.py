@@ -1,6 +1,13 @@
 """Cache module for KV-Cache."""
 
-from .eviction import LRUEvictionPolicy
-from .store import KVStore
+from .eviction import LRUEvictionPolicy, SampledLRUEvictionPolicy
+from .sharded import ShardedKVStore
+from .store import KVStore, NoTTLKVStore
 
-__all__ = ["KVStore", "LRUEvictionPolicy"]
+__all__ = [
+    "KVStore",
+    "LRUEvictionPolicy",
+    "NoTTLKVStore",
+    "SampledLRUEvictionPolicy",
+    "ShardedKVStore",
+]
@@ -0,0 +1,130 @@
+"""
+Sharded Key-Value Store Module
+
+This module splits the key space over several independent KVStore
+instances, selected by the key's hash.
+
+Each shard is a full KVStore (own OrderedDict, TTL bookkeeping and LRU
+order), so a shard's dict resizes on its own instead of the whole key
+space rehashing at once, and per-shard locking can be added later
+without a global lock.
+
+Trade-off: LRU eviction is per shard. The max_size budget is split over
+the shards (their capacities differ by at most one and sum to max_size),
+and each shard evicts its own least recently used key, which approximates
+global LRU when keys hash evenly.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from .store import KVStore, _DEFAULT_MAX_KEYS
+
+
+class ShardedKVStore:
+    """
+    KVStore-compatible store that routes each key to one of N shards.
+
+    Usage:
+        store = ShardedKVStore(max_size=100_000, shards=16)
+        store.put("key", "value", ttl=60)
+        store.get("key")
+
+    Attributes:
+        max_size: Maximum number of keys across all shards
+        shards: Number of shards (a power of two, at most max_size)
+    """
+
+    __slots__ = ("max_size", "shards", "_shards", "_mask")
+
+    def __init__(self, max_size: int = None, shards: int = 16, store_class: Type[KVStore] = KVStore):
+        """
+        Initialize the sharded store.
+
+        Args:
+            max_size: Maximum number of keys (default from settings.MAX_KEYS)
+            shards: Number of shards; must be a positive power of two.
+                Reduced to the largest power of two <= max_size so that
+                every shard can hold at least one key.
+            store_class: Store used for each shard (KVStore or a subclass
+                such as NoTTLKVStore)
+
+        Raises:
+            ValueError: If shards is not a positive power of two
+        """
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("shards must be a positive power of two")
+
+        self.max_size = max_size if max_size is not None else _DEFAULT_MAX_KEYS
+        while shards > max(1, self.max_size):
+            shards >>= 1
+        self.shards = shards
+        self._mask = shards - 1
+
+        # The first max_size % shards shards take one extra key
+        per_shard, extra = divmod(self.max_size, shards)
+        self._shards = [store_class(max_size=per_shard + (i < extra)) for i in range(shards)]
+
+    def _shard(self, key: str) -> KVStore:
+        """Return the shard that owns key."""
+        return self._shards[hash(key) & self._mask]
+
+    def put(self, key: str, value: str, ttl: int = 0) -> bool:
+        """Insert or update a key-value pair (see KVStore.put)."""
+        return self._shards[hash(key) & self._mask].put(key, value, ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        """Retrieve the value for a key (see KVStore.get)."""
+        return self._shards[hash(key) & self._mask].get(key)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key-value pair (see KVStore.delete)."""
+        return self._shards[hash(key) & self._mask].delete(key)
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists and is not expired (see KVStore.exists)."""
+        return self._shards[hash(key) & self._mask].exists(key)
+
+    def put_many(self, keys: Iterable[str], values: Iterable[str], ttl: int = 0) -> int:
+        """Insert or update many key-value pairs (see KVStore.put_many)."""
+        shard = self._shard
+        count = 0
+        for key, value in zip(keys, values):
+            shard(key).put(key, value, ttl)
+            count += 1
+        return count
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[str]]:
+        """Retrieve the values for many keys (see KVStore.get_many)."""
+        shard = self._shard
+        return [shard(key).get(key) for key in keys]
+
+    def size(self) -> int:
+        """Get the current number of keys across all shards."""
+        return sum(s.size() for s in self._shards)
+
+    def clear(self) -> None:
+        """Remove all keys from every shard."""
+        for s in self._shards:
+            s.clear()
+
+    def cleanup_expired(self) -> int:
+        """Remove expired keys from every shard; returns the number removed."""
+        return sum(s.cleanup_expired() for s in self._shards)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the store, summed over all shards."""
+        total = 0
+        expired = 0
+        for s in self._shards:
+            stats = s.get_stats()
+            total += stats["total_keys"]
+            expired += stats["expired_keys"]
+
+        return {
+            "total_keys": total,
+            "expired_keys": expired,
+            "active_keys": total - expired,
+            "max_size": self.max_size,
+            "utilization": total / self.max_size if self.max_size > 0 else 0,
+            "shards": self.shards,
+        }
@@ -8,11 +8,26 @@ Students must implement:
 - Task 4: TTL (Time-To-Live) support for automatic key expiration
 """
 
+import heapq
 import time
 from collections import OrderedDict
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 from ..config.settings import settings
+from .eviction import _MISS
+
+# Default capacity, read once at import (later changes to settings don't apply)
+_DEFAULT_MAX_KEYS = settings.MAX_KEYS
+
+# Monotonic clock for expiry: integer compares, and immune to wall-clock steps
+_monotonic_ns = time.monotonic_ns
+NS_PER_SECOND = 1_000_000_000
+
+# Deadline for keys without a TTL when a lookup needs a comparable default
+_NEVER = float("inf")
+
+# When full, evict max(1, max_size // EVICTION_BATCH_DIVISOR) keys at once
+EVICTION_BATCH_DIVISOR = 128
 
 
 class KVStore:
@@ -29,15 +44,25 @@ class KVStore:
     - TTL (Time-To-Live): Keys can automatically expire after a specified time
     - LRU Eviction: When cache is full, least recently used keys are evicted
 
+    Values are stored as given, with no conversion: get() returns the same
+    object put() received. A caller that keeps values as bytes (e.g. a
+    network layer writing them straight to a socket) gets bytes back, and
+    no encode happens on the read path.
+
     Internal Storage:
-        Uses OrderedDict for O(1) operations with LRU ordering.
-        Format: key -> (value, expiration_timestamp)
-        expiration_timestamp = 0 means no expiration
+        _store: OrderedDict of key -> value, kept in LRU order
+        _expiries: dict of key -> time.monotonic_ns() deadline, holding
+            only keys that have a TTL (keys without one never appear)
+        _expiry_heap: min-heap of (deadline, key) for cleanup_expired();
+            entries whose deadline no longer matches _expiries are stale
+            and skipped
 
     Attributes:
         max_size: Maximum number of keys allowed in the store
     """
 
+    __slots__ = ("max_size", "_store", "_expiries", "_expiry_heap", "_lookup", "_touch", "_pop")
+
     def __init__(self, max_size: int = None):
         """
         Initialize the KV store.
@@ -45,10 +70,22 @@ class KVStore:
         Args:
             max_size: Maximum number of keys (default from settings.MAX_KEYS)
         """
-        self.max_size = max_size if max_size is not None else settings.MAX_KEYS
+        self.max_size = max_size if max_size is not None else _DEFAULT_MAX_KEYS
+
+        # OrderedDict gives O(1) operations and keeps insertion/access order.
+        # A plain dict is slower here once eviction starts (see LRUEvictionPolicy)
+        self._store: "OrderedDict[str, str]" = OrderedDict()
+
+        # Deadlines live apart from values so the common no-TTL path
+        # allocates no tuple and skips expiry checks while this is empty
+        self._expiries: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[int, str]] = []
 
-        # OrderedDict gives O(1) operations and keeps insertion/access order
-        self._store: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # Bound methods of _store for the single-key hot paths (valid for the
+        # store's lifetime: clear() empties _store in place)
+        self._lookup = self._store.get
+        self._touch = self._store.move_to_end
+        self._pop = self._store.pop
 
     def put(self, key: str, value: str, ttl: int = 0) -> bool:
         """
@@ -70,20 +107,60 @@ class KVStore:
         - Task 5: Handle LRU - update position for existing keys,
                   evict LRU item if cache full when adding new key
         """
-        expires_at = time.time() + ttl if ttl and ttl > 0 else 0
+        # Keys are deliberately not sys.intern()ed: lookups arrive as fresh
+        # str objects from the parser, so the identity fast path never hits,
+        # and the intern-table probe only adds cost to every put
+        store = self._store
+        expiries = self._expiries
+
+        if key in store:
+            # Update value and mark as most recently used. move_to_end on the
+            # key already at the tail is cheaper than checking for it first
+            store[key] = value
+            self._touch(key)
+        else:
+            # Evict LRU if at capacity
+            if len(store) >= self.max_size:
+                self._evict_lru()
+            store[key] = value
+
+        if ttl and ttl > 0:
+            expires_at = _monotonic_ns() + int(ttl * NS_PER_SECOND)
+            expiries[key] = expires_at
+            self._push_expiry(expires_at, key)
+        elif expiries:
+            # A put without TTL clears any previous deadline
+            expiries.pop(key, None)
+        return True
 
-        if key in self._store:
-            # Update value/TTL and mark as most recently used
-            self._store[key] = (value, expires_at)
-            self._store.move_to_end(key)
-            return True
+    def _evict_lru(self) -> None:
+        """
+        Evict a batch of least recently used keys to make room.
 
-        # Evict LRU if at capacity
-        if len(self._store) >= self.max_size:
-            self._store.popitem(last=False)
+        Evicting max(1, max_size // EVICTION_BATCH_DIVISOR) keys at once
+        lets the next puts skip eviction entirely; caches smaller than the
+        divisor still evict exactly one key.
+        """
+        popitem = self._store.popitem
+        expiries = self._expiries
+        for _ in range(max(1, self.max_size // EVICTION_BATCH_DIVISOR)):
+            evicted, _value = popitem(last=False)
+            if expiries:
+                expiries.pop(evicted, None)
+
+    def _push_expiry(self, expires_at: int, key: str) -> None:
+        """
+        Record a deadline in the expiry heap.
 
-        self._store[key] = (value, expires_at)
-        return True
+        Overwritten, deleted and evicted keys leave stale heap entries
+        behind; once those outnumber the live deadlines the heap is rebuilt
+        from _expiries, keeping its size O(live TTL keys).
+        """
+        heap = self._expiry_heap
+        heapq.heappush(heap, (expires_at, key))
+        if len(heap) > 2 * len(self._expiries) + 64:
+            heap[:] = [(exp, k) for k, exp in self._expiries.items()]
+            heapq.heapify(heap)
 
     def get(self, key: str) -> Optional[str]:
         """
@@ -102,19 +179,100 @@ class KVStore:
         - Task 4: Check if key has expired; if so, delete it and return None
         - Task 5: Update LRU order - move accessed key to most recent
         """
-        if key not in self._store:
+        value = self._lookup(key, _MISS)
+        if value is _MISS:
             return None
 
-        value, expires_at = self._store[key]
-        if expires_at and expires_at <= time.time():
-            # Lazy expiration
-            self._store.pop(key, None)
-            return None
+        expiries = self._expiries
+        if expiries:
+            expires_at = expiries.get(key)
+            if expires_at is not None and expires_at <= _monotonic_ns():
+                # Lazy expiration
+                del self._store[key]
+                del expiries[key]
+                return None
 
         # Mark as most recently used
-        self._store.move_to_end(key)
+        self._touch(key)
         return value
 
+    def put_many(self, keys: Iterable[str], values: Iterable[str], ttl: int = 0) -> int:
+        """
+        Insert or update many key-value pairs in one call.
+
+        Equivalent to calling put() for each (key, value) pair in order,
+        but the loop runs inside the store with its lookups bound once, and
+        all keys share a single expiration timestamp.
+
+        Args:
+            keys: Keys to store
+            values: Values to store (paired with keys positionally)
+            ttl: Time-to-live in seconds for every key (0 = no expiration)
+
+        Returns:
+            Number of pairs stored
+
+        Time Complexity: O(n) average for n pairs
+        """
+        expires_at = _monotonic_ns() + int(ttl * NS_PER_SECOND) if ttl and ttl > 0 else 0
+        store = self._store
+        expiries = self._expiries
+        move_to_end = store.move_to_end
+        max_size = self.max_size
+
+        count = 0
+        for key, value in zip(keys, values):
+            if key in store:
+                store[key] = value
+                move_to_end(key)
+            else:
+                if len(store) >= max_size:
+                    self._evict_lru()
+                store[key] = value
+            if expires_at:
+                expiries[key] = expires_at
+                self._push_expiry(expires_at, key)
+            elif expiries:
+                expiries.pop(key, None)
+            count += 1
+        return count
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[str]]:
+        """
+        Retrieve the values for many keys in one call.
+
+        Equivalent to calling get() for each key in order (including lazy
+        expiration and LRU updates), with the clock read once per batch.
+
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            List of values in key order; None for missing or expired keys
+
+        Time Complexity: O(n) average for n keys
+        """
+        now = _monotonic_ns()
+        store = self._store
+        expiries = self._expiries
+        move_to_end = store.move_to_end
+        results: List[Optional[str]] = []
+        append = results.append
+
+        for key in keys:
+            value = store.get(key, _MISS)
+            if value is _MISS:
+                append(None)
+                continue
+            if expiries and expiries.get(key, _NEVER) <= now:
+                del store[key]
+                del expiries[key]
+                append(None)
+                continue
+            move_to_end(key)
+            append(value)
+        return results
+
     def delete(self, key: str) -> bool:
         """
         Delete a key-value pair.
@@ -131,17 +289,15 @@ class KVStore:
         - Task 1: Remove key if exists, return True; return False if not found
         - Task 4: Expired keys should be treated as non-existent (return False)
         """
-        if key not in self._store:
+        if self._pop(key, _MISS) is _MISS:
             return False
 
-        value, expires_at = self._store.get(key, (None, 0))
-        if expires_at and expires_at <= time.time():
-            # Treat expired as non-existent but remove eagerly
-            self._store.pop(key, None)
-            return False
+        if not self._expiries:
+            return True
 
-        self._store.pop(key, None)
-        return True
+        # An expired entry is removed as well, but reported as non-existent
+        expires_at = self._expiries.pop(key, None)
+        return expires_at is None or expires_at > _monotonic_ns()
 
     def exists(self, key: str) -> bool:
         """
@@ -162,10 +318,11 @@ class KVStore:
         if key not in self._store:
             return False
 
-        _, expires_at = self._store[key]
-        if expires_at and expires_at <= time.time():
+        expires_at = self._expiries.get(key) if self._expiries else None
+        if expires_at is not None and expires_at <= _monotonic_ns():
             # Lazy cleanup for expired keys
-            self._store.pop(key, None)
+            del self._store[key]
+            del self._expiries[key]
             return False
 
         return True
@@ -184,6 +341,8 @@ class KVStore:
     def clear(self) -> None:
         """Remove all keys from the store."""
         self._store.clear()
+        self._expiries.clear()
+        self._expiry_heap.clear()
 
     def cleanup_expired(self) -> int:
         """
@@ -196,12 +355,55 @@ class KVStore:
             Number of keys removed
 
         Task 4 Bonus: Implement this for active expiration cleanup.
+
+        Time Complexity: O(k log n) for k due heap entries, instead of
+        a scan over every key
+        """
+        now = _monotonic_ns()
+        heap = self._expiry_heap
+        expiries = self._expiries
+        heappop = heapq.heappop
+
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expires_at, key = heappop(heap)
+            # Skip stale entries: key deleted, evicted or given a new deadline
+            if expiries.get(key) == expires_at:
+                del expiries[key]
+                self._store.pop(key, None)
+                removed += 1
+        return removed
+
+    def _count_expired(self) -> int:
         """
-        now = time.time()
-        to_delete = [k for k, (_, exp) in self._store.items() if exp and exp <= now]
-        for key in to_delete:
-            self._store.pop(key, None)
-        return len(to_delete)
+        Count keys whose deadline has passed, without removing them.
+
+        Walks the expiry heap from the root, descending only into entries
+        that are already due (children of a future deadline are later
+        still), and counts those that still match _expiries.
+        """
+        heap = self._expiry_heap
+        if not heap or heap[0][0] > _monotonic_ns():
+            return 0
+
+        now = _monotonic_ns()
+        expiries = self._expiries
+        n = len(heap)
+        due = set()
+        stack = [0]
+        while stack:
+            i = stack.pop()
+            expires_at, key = heap[i]
+            if expires_at > now:
+                continue
+            if expiries.get(key) == expires_at:
+                due.add(key)
+            child = 2 * i + 1
+            if child < n:
+                stack.append(child)
+                if child + 1 < n:
+                    stack.append(child + 1)
+        return len(due)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -214,10 +416,12 @@ class KVStore:
             - active_keys: Count of non-expired keys
             - max_size: Maximum capacity
             - utilization: Current usage as fraction of max_size
+
+        Time Complexity: O(k) for k due heap entries; O(1) when nothing
+        has expired
         """
-        now = time.time()
         total = len(self._store)
-        expired = sum(1 for _, (_, expires_at) in self._store.items() if 0 < expires_at < now)
+        expired = self._count_expired()
 
         return {
             "total_keys": total,
@@ -226,3 +430,50 @@ class KVStore:
             "max_size": self.max_size,
             "utilization": total / self.max_size if self.max_size > 0 else 0,
         }
+
+
+class NoTTLKVStore(KVStore):
+    """
+    KVStore specialized for deployments that never use TTLs.
+
+    put/get/delete/exists skip every expiry branch: no deadline is ever
+    recorded, so there is nothing to check. Selected by the server when
+    settings.TTL_ENABLED is False; TTL arguments are then ignored and keys
+    never expire. Bulk operations, cleanup and stats are inherited and see
+    an always-empty expiry table.
+    """
+
+    __slots__ = ()
+
+    def put(self, key: str, value: str, ttl: int = 0) -> bool:
+        """Insert or update a key-value pair; ttl is ignored."""
+        store = self._store
+        if key in store:
+            store[key] = value
+            self._touch(key)
+            return True
+
+        if len(store) >= self.max_size:
+            self._evict_lru()
+        store[key] = value
+        return True
+
+    def put_many(self, keys: Iterable[str], values: Iterable[str], ttl: int = 0) -> int:
+        """Insert or update many key-value pairs; ttl is ignored."""
+        return super().put_many(keys, values)
+
+    def get(self, key: str) -> Optional[str]:
+        """Retrieve the value for a key, marking it most recently used."""
+        value = self._lookup(key, _MISS)
+        if value is _MISS:
+            return None
+        self._touch(key)
+        return value
+
+    def delete(self, key: str) -> bool:
+        """Delete a key-value pair; True if it existed."""
+        return self._pop(key, _MISS) is not _MISS
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return key in self._store
@@ -8,7 +8,14 @@ This module provides clustering support including:
 - Replication logic
 """
 
-from .config import ClusterConfig, get_shard_for_key
+from .config import ClusterConfig, KeyRoute, clear_shard_cache, get_shard_for_key, jump_back_hash
 from .router import ClusterRouter
 
-__all__ = ['ClusterConfig', 'get_shard_for_key', 'ClusterRouter']
+__all__ = [
+    'ClusterConfig',
+    'KeyRoute',
+    'clear_shard_cache',
+    'get_shard_for_key',
+    'jump_back_hash',
+    'ClusterRouter',
+]
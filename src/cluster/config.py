@@ -21,8 +21,16 @@ Node Addresses:
 - Node 3: localhost:5003
 """
 
+import functools
 import hashlib
-from typing import Dict, Tuple, Optional
+import os
+from typing import Dict, NamedTuple, Tuple, Optional
+
+# Optional xxHash for KV_CACHE_SHARD_HASH=xxh3 (pip install xxhash)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 
 # Cluster Constants
@@ -38,11 +46,8 @@ SHARD_MAP: Dict[int, Tuple[int, int]] = {
 
 # Node addresses: node_id -> (host, port)
 # Uses container names for Docker, but also works with localhost
-import os
-
 # Check if we're in Docker (container names) or local (localhost)
 _use_docker = os.getenv('DOCKER_ENV', 'false').lower() == 'true'
-_host_prefix = '' if _use_docker else 'localhost'
 
 NODE_ADDRESSES: Dict[int, Tuple[str, int]] = {
     1: ('kv-cache-node1' if _use_docker else 'localhost', 5001),
@@ -51,6 +56,119 @@ NODE_ADDRESSES: Dict[int, Tuple[str, int]] = {
 }
 
 
+# Key hash used for shard placement. Every node must use the same one, so it
+# is chosen explicitly instead of by whichever packages happen to be installed:
+#   sha256 - stdlib (default)
+#   xxh3   - xxHash3-64, ~5x cheaper per short key; requires xxhash
+SHARD_HASH = os.getenv('KV_CACHE_SHARD_HASH', 'sha256').lower()
+
+
+def _sha256_hash(data: bytes) -> int:
+    """First 8 bytes of the SHA-256 digest as a big-endian integer."""
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], byteorder='big')
+
+
+if SHARD_HASH == 'sha256':
+    _hash_key = _sha256_hash
+elif SHARD_HASH == 'xxh3':
+    if xxhash is None:
+        raise ImportError("KV_CACHE_SHARD_HASH=xxh3 requires the xxhash package (pip install xxhash)")
+    _hash_key = xxhash.xxh3_64_intdigest
+else:
+    raise ValueError(f"Unknown KV_CACHE_SHARD_HASH: {SHARD_HASH!r} (expected 'sha256' or 'xxh3')")
+
+
+# How the 64-bit key hash is mapped to a shard. Also cluster-wide:
+#   modulo   - hash % NUM_SHARDS (default); changing NUM_SHARDS moves
+#              about (N-1)/N of all keys
+#   jumpback - JumpBackHash consistent hashing; growing from N to N+1
+#              shards moves only the ~1/(N+1) of keys that land on the new one
+HASH_STRATEGY = os.getenv('KV_CACHE_HASH_STRATEGY', 'modulo').lower()
+
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(state: int) -> Tuple[int, int]:
+    """Advance a SplitMix64 generator; returns (new_state, 64-bit output)."""
+    state = (state + 0x9E3779B97F4A7C15) & _MASK64
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return state, z ^ (z >> 31)
+
+
+def jump_back_hash(key_hash: int, num_buckets: int) -> int:
+    """
+    Map a 64-bit key hash to a bucket in [0, num_buckets) consistently.
+
+    JumpBackHash (Ertl, 2024): same distribution as Jump Consistent Hash,
+    but it walks the key's jumps backwards from the highest power-of-two
+    range below num_buckets, so it takes expected O(1) steps instead of
+    O(log n), using only integer arithmetic.
+
+    For every key the set of "jump" buckets is fixed; the result is the
+    largest jump below num_buckets. Adding a bucket therefore only moves
+    keys onto the new bucket, never between existing ones.
+
+    Args:
+        key_hash: Non-negative 64-bit hash of the key
+        num_buckets: Number of buckets; must be positive
+
+    Returns:
+        Bucket index in [0, num_buckets)
+    """
+    if num_buckets <= 0:
+        raise ValueError("num_buckets must be positive")
+
+    # Bit i of u says whether the key jumps at least once inside the range
+    # [2^i, 2^(i+1)); that happens with probability 1/2 for every range.
+    _, u = _splitmix64(key_hash)
+    u &= (1 << (num_buckets - 1).bit_length()) - 1
+
+    while u:
+        level = u.bit_length() - 1
+        low = 1 << level
+        # Each range draws from its own stream so its jumps do not depend
+        # on which higher ranges were visited (i.e. on num_buckets).
+        state = key_hash ^ ((level + 1) * 0xD1B54A32D192ED03 & _MASK64)
+
+        # The last jump in the range is uniform over it
+        state, r = _splitmix64(state)
+        jump = low | (r & (low - 1))
+        while jump >= num_buckets:
+            # Step back to the previous jump, uniform over [0, jump);
+            # rejection sampling from [0, 2 * low) accepts at least half
+            state, r = _splitmix64(state)
+            prev = r & ((low << 1) - 1)
+            if prev < jump:
+                jump = prev
+        if jump >= low:
+            return jump
+        # No jump in this range is below num_buckets; try the next lower one
+        u ^= low
+
+    return 0
+
+
+def _modulo_bucket(key_hash: int, num_buckets: int) -> int:
+    """Map a key hash to a bucket with a plain modulo."""
+    return key_hash % num_buckets
+
+
+if HASH_STRATEGY == 'modulo':
+    _bucket = _modulo_bucket
+elif HASH_STRATEGY == 'jumpback':
+    _bucket = jump_back_hash
+else:
+    raise ValueError(f"Unknown KV_CACHE_HASH_STRATEGY: {HASH_STRATEGY!r} (expected 'modulo' or 'jumpback')")
+
+
+# Recently used keys whose shard is remembered, so hot keys skip hashing.
+# 0 disables the cache.
+SHARD_CACHE_SIZE = int(os.getenv('KV_CACHE_SHARD_CACHE_SIZE', '4096'))
+
+
+@functools.lru_cache(maxsize=SHARD_CACHE_SIZE)
 def get_shard_for_key(key: str) -> int:
     """
     Calculate which shard owns a given key.
@@ -65,14 +183,34 @@ def get_shard_for_key(key: str) -> int:
         Shard ID (0, 1, or 2)
         
     Implementation:
-        - Use hashlib.sha256 for consistent hashing
-        - Convert hash to integer and mod by NUM_SHARDS
+        - Hash the UTF-8 key with SHARD_HASH (SHA-256 or xxHash3-64)
+        - Map the 64-bit hash to a shard with HASH_STRATEGY
+          (modulo NUM_SHARDS, or jump_back_hash)
+        - Results for the last SHARD_CACHE_SIZE keys are cached; hit rate
+          is available from get_shard_for_key.cache_info()
     """
-    # Use SHA256 for consistent hashing across all nodes
-    hash_digest = hashlib.sha256(key.encode('utf-8')).digest()
-    # Convert first 8 bytes to int
-    hash_int = int.from_bytes(hash_digest[:8], byteorder='big')
-    return hash_int % NUM_SHARDS
+    return _bucket(_hash_key(key.encode('utf-8')), NUM_SHARDS)
+
+
+def clear_shard_cache() -> None:
+    """Forget cached shard assignments (needed after changing NUM_SHARDS)."""
+    get_shard_for_key.cache_clear()
+
+
+class KeyRoute(NamedTuple):
+    """
+    Everything needed to route one key, from a single hash.
+
+    Attributes:
+        shard: Shard that owns the key
+        is_primary: True if this node is the shard's primary
+        primary_addr: (host, port) of the shard's primary
+        replica_addr: (host, port) of the shard's replica
+    """
+    shard: int
+    is_primary: bool
+    primary_addr: Tuple[str, int]
+    replica_addr: Tuple[str, int]
 
 
 class ClusterConfig:
@@ -103,34 +241,53 @@ class ClusterConfig:
         # Pre-compute which shards this node owns
         self.primary_shards = [shard for shard, (primary, _) in SHARD_MAP.items() if primary == node_id]
         self.replica_shards = [shard for shard, (_, replica) in SHARD_MAP.items() if replica == node_id]
+
+        # Per-shard lookup tables indexed by shard id, so the per-key checks
+        # are one hash plus one tuple index (no dict lookup or unpacking)
+        shards = range(NUM_SHARDS)
+        self._primary_by_shard = tuple(SHARD_MAP[s][0] for s in shards)
+        self._replica_by_shard = tuple(SHARD_MAP[s][1] for s in shards)
+        self._is_primary = tuple(p == node_id for p in self._primary_by_shard)
+        self._is_replica = tuple(r == node_id for r in self._replica_by_shard)
+        self._routes = tuple(
+            KeyRoute(
+                s,
+                self._is_primary[s],
+                NODE_ADDRESSES[self._primary_by_shard[s]],
+                NODE_ADDRESSES[self._replica_by_shard[s]],
+            )
+            for s in shards
+        )
         
     def get_shard(self, key: str) -> int:
         """Get the shard ID for a key."""
         return get_shard_for_key(key)
     
+    def route(self, key: str) -> KeyRoute:
+        """
+        Get the routing info for a key, hashing it once.
+
+        Callers that need several of shard, ownership and node addresses
+        for the same key should use this instead of the per-field methods,
+        each of which hashes the key again.
+        """
+        return self._routes[get_shard_for_key(key)]
+
     def is_primary_for_key(self, key: str) -> bool:
         """Check if this node is the primary for the given key."""
-        shard = self.get_shard(key)
-        primary, _ = self.shard_map[shard]
-        return primary == self.node_id
+        return self._is_primary[get_shard_for_key(key)]
     
     def is_replica_for_key(self, key: str) -> bool:
         """Check if this node is the replica for the given key."""
-        shard = self.get_shard(key)
-        _, replica = self.shard_map[shard]
-        return replica == self.node_id
+        return self._is_replica[get_shard_for_key(key)]
     
     def get_primary_for_key(self, key: str) -> int:
         """Get the node ID of the primary for the given key."""
-        shard = self.get_shard(key)
-        primary, _ = self.shard_map[shard]
-        return primary
+        return self._primary_by_shard[get_shard_for_key(key)]
     
     def get_replica_for_key(self, key: str) -> int:
         """Get the node ID of the replica for the given key."""
-        shard = self.get_shard(key)
-        _, replica = self.shard_map[shard]
-        return replica
+        return self._replica_by_shard[get_shard_for_key(key)]
     
     def get_node_address(self, node_id: int) -> Tuple[str, int]:
         """
@@ -162,7 +319,7 @@ class ClusterConfig:
             return True
         
         # For client requests, only primary handles them (may need to forward)
-        return self.is_primary_for_key(key)
+        return self._is_primary[get_shard_for_key(key)]
     
     def __repr__(self) -> str:
         return (f"ClusterConfig(node_id={self.node_id}, "
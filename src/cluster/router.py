@@ -7,14 +7,45 @@ Provides TCP client functionality to communicate with other nodes.
 
 import asyncio
 import logging
-from typing import Optional, Tuple
+import time
+from asyncio import StreamReader, StreamWriter
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
+from ..config.settings import settings
 from ..protocol.commands import Command, Response, CommandType
 from ..protocol.parser import ProtocolParser
 from .config import ClusterConfig
 
 logger = logging.getLogger(__name__)
 
+# (reader, writer, time.monotonic() when returned to the pool)
+_PooledConnection = Tuple[StreamReader, StreamWriter, float]
+
+
+def _format_put(command: Command) -> str:
+    if command.ttl > 0:
+        return f"PUT {command.key} {command.value} {command.ttl}\n"
+    return f"PUT {command.key} {command.value}\n"
+
+
+def _format_repl_put(command: Command) -> str:
+    if command.ttl > 0:
+        return f"REPL_PUT {command.key} {command.value} {command.ttl}\n"
+    return f"REPL_PUT {command.key} {command.value}\n"
+
+
+# Wire format per command type: one dict lookup instead of a chain of Enum
+# comparisons. Lines stay str so a whole batch is encoded in one call.
+_COMMAND_FORMATTERS = {
+    CommandType.PUT: _format_put,
+    CommandType.GET: lambda command: f"GET {command.key}\n",
+    CommandType.DELETE: lambda command: f"DELETE {command.key}\n",
+    CommandType.EXISTS: lambda command: f"EXISTS {command.key}\n",
+    CommandType.REPL_PUT: _format_repl_put,
+    CommandType.REPL_DELETE: lambda command: f"REPL_DELETE {command.key}\n",
+}
+
 
 class ClusterRouter:
     """
@@ -24,41 +55,71 @@ class ClusterRouter:
     - Forward client requests to the primary node
     - Send replication commands to replica nodes
     - Handle TCP connections to other nodes
+
+    Connections to peers are reused: each request takes an idle
+    connection for its address (or opens one), and returns it afterwards.
+    A connection carries one request at a time, so no locking is needed.
+    At most pool_size idle connections are kept per peer, and ones idle
+    longer than idle_timeout are closed instead of reused.
     """
     
-    def __init__(self, cluster_config: ClusterConfig):
+    def __init__(
+            self,
+            cluster_config: ClusterConfig,
+            pool_size: int = None,
+            idle_timeout: float = None,
+    ):
         """
         Initialize the cluster router.
         
         Args:
             cluster_config: The cluster configuration for this node
+            pool_size: Max idle connections kept per peer
+                (default from settings.CLUSTER_POOL_SIZE; 0 disables reuse)
+            idle_timeout: Seconds an idle connection may be reused
+                (default from settings.CONNECTION_TIMEOUT)
         """
         self.config = cluster_config
         self.parser = ProtocolParser()
+        self.pool_size = pool_size if pool_size is not None else settings.CLUSTER_POOL_SIZE
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.CONNECTION_TIMEOUT
+        self._idle: Dict[Tuple[str, int], Deque[_PooledConnection]] = {}
+        # Peer host -> IP it was last reached at, so new connections skip
+        # getaddrinfo (which asyncio runs in a thread for non-numeric hosts)
+        self._resolved: Dict[str, str] = {}
         
-    async def forward_to_primary(self, command: Command) -> Response:
+    async def forward_to_primary(self, command: Command, address: Optional[Tuple[str, int]] = None) -> Response:
         """
         Forward a command to the primary node for the key.
         
         Args:
             command: The command to forward
+            address: (host, port) of the primary, if already known
+                (e.g. from ClusterConfig.route); derived from the key otherwise
             
         Returns:
             The response from the primary node
         """
-        primary_node = self.config.get_primary_for_key(command.key)
-        host, port = self.config.get_node_address(primary_node)
+        if address is None:
+            address = self.config.route(command.key).primary_addr
+        host, port = address
         
-        logger.debug(f"Forwarding {command.type.name} {command.key} to node {primary_node}")
+        logger.debug("Forwarding %s %s to %s:%s", command.type.name, command.key, host, port)
         
         try:
             response = await self._send_command(host, port, command)
             return response
         except Exception as e:
-            logger.error(f"Failed to forward to node {primary_node}: {e}")
+            logger.error(f"Failed to forward to {host}:{port}: {e}")
             return Response.error(f"forwarding failed: {e}")
     
-    async def replicate_put(self, key: str, value: str, ttl: int = 0) -> bool:
+    async def replicate_put(
+            self,
+            key: str,
+            value: str,
+            ttl: int = 0,
+            address: Optional[Tuple[str, int]] = None,
+    ) -> bool:
         """
         Replicate a PUT operation to the replica node.
         
@@ -66,14 +127,17 @@ class ClusterRouter:
             key: The key being stored
             value: The value to store
             ttl: Time-to-live in seconds
+            address: (host, port) of the replica, if already known;
+                derived from the key otherwise
             
         Returns:
             True if replication succeeded, False otherwise
         """
-        replica_node = self.config.get_replica_for_key(key)
-        host, port = self.config.get_node_address(replica_node)
+        if address is None:
+            address = self.config.route(key).replica_addr
+        host, port = address
         
-        logger.debug(f"Replicating PUT {key} to replica node {replica_node}")
+        logger.debug("Replicating PUT %s to replica %s:%s", key, host, port)
         
         # Create internal replication command
         repl_command = Command(
@@ -87,29 +151,32 @@ class ClusterRouter:
         try:
             response = await self._send_command(host, port, repl_command)
             if response.status.value == "OK":
-                logger.debug(f"Replication PUT {key} succeeded")
+                logger.debug("Replication PUT %s succeeded", key)
                 return True
             else:
                 logger.error(f"Replication PUT {key} failed: {response.message}")
                 return False
         except Exception as e:
-            logger.error(f"Failed to replicate PUT to node {replica_node}: {e}")
+            logger.error(f"Failed to replicate PUT to {host}:{port}: {e}")
             return False
     
-    async def replicate_delete(self, key: str) -> bool:
+    async def replicate_delete(self, key: str, address: Optional[Tuple[str, int]] = None) -> bool:
         """
         Replicate a DELETE operation to the replica node.
         
         Args:
             key: The key being deleted
+            address: (host, port) of the replica, if already known;
+                derived from the key otherwise
             
         Returns:
             True if replication succeeded, False otherwise
         """
-        replica_node = self.config.get_replica_for_key(key)
-        host, port = self.config.get_node_address(replica_node)
+        if address is None:
+            address = self.config.route(key).replica_addr
+        host, port = address
         
-        logger.debug(f"Replicating DELETE {key} to replica node {replica_node}")
+        logger.debug("Replicating DELETE %s to replica %s:%s", key, host, port)
         
         # Create internal replication command
         repl_command = Command(
@@ -121,15 +188,48 @@ class ClusterRouter:
         try:
             response = await self._send_command(host, port, repl_command)
             if response.status.value == "OK":
-                logger.debug(f"Replication DELETE {key} succeeded")
+                logger.debug("Replication DELETE %s succeeded", key)
                 return True
             else:
                 logger.error(f"Replication DELETE {key} failed: {response.message}")
                 return False
         except Exception as e:
-            logger.error(f"Failed to replicate DELETE to node {replica_node}: {e}")
+            logger.error(f"Failed to replicate DELETE to {host}:{port}: {e}")
             return False
     
+    async def replicate_batch(self, commands: Sequence[Command], address: Tuple[str, int]) -> List[bool]:
+        """
+        Replicate several client PUT/DELETE commands to one replica.
+
+        The REPL_PUT/REPL_DELETE lines are pipelined on one pooled
+        connection: a single write, then one response line per command.
+        The replica handles them in order, as if sent one at a time.
+
+        Args:
+            commands: Client PUT/DELETE commands already applied locally
+            address: (host, port) of the replica
+
+        Returns:
+            Per command, True if the replica applied it
+        """
+        host, port = address
+        repl_commands = []
+        for command in commands:
+            if command.type == CommandType.PUT:
+                repl_commands.append(Command(
+                    type=CommandType.REPL_PUT,
+                    key=command.key,
+                    value=command.value,
+                    ttl=command.ttl,
+                ))
+            else:
+                repl_commands.append(Command(type=CommandType.REPL_DELETE, key=command.key))
+
+        logger.debug("Replicating batch of %d to replica %s:%s", len(repl_commands), host, port)
+
+        responses = await self._send_commands(host, port, repl_commands)
+        return [response.status.value == "OK" for response in responses]
+
     async def _send_command(self, host: str, port: int, command: Command, timeout: float = 5.0) -> Response:
         """
         Send a command to another node via TCP.
@@ -143,40 +243,161 @@ class ClusterRouter:
         Returns:
             Response from the target node
         """
+        responses = await self._send_commands(host, port, [command], timeout)
+        return responses[0]
+
+    async def _send_commands(
+            self,
+            host: str,
+            port: int,
+            commands: Sequence[Command],
+            timeout: float = 5.0,
+    ) -> List[Response]:
+        """
+        Send commands to another node in one write and read their responses.
+
+        Args:
+            host: Target host
+            port: Target port
+            commands: Commands to send, answered in order
+            timeout: Connection timeout in seconds
+
+        Returns:
+            One Response per command
+        """
+        payload = "".join(self._format_command(command) for command in commands).encode()
+        count = len(commands)
+        address = (host, port)
+
         try:
-            # Open connection to target node
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(host, port),
-                timeout=timeout
-            )
-            
-            try:
-                # Format and send command
-                formatted_cmd = self._format_command(command)
-                writer.write(formatted_cmd.encode())
-                await writer.drain()
-                
-                # Read response
-                data = await asyncio.wait_for(reader.readline(), timeout=timeout)
-                if not data:
-                    return Response.error("empty response from node")
-                
-                # Parse response
-                response_str = data.decode().strip()
-                response = self._parse_response(response_str)
-                return response
-                
-            finally:
-                writer.close()
-                await writer.wait_closed()
-                
+            lines: Optional[List[bytes]] = None
+            conn = self._take_idle(address)
+            if conn is not None:
+                lines = await self._roundtrip(conn, payload, count, timeout)
+                if not lines:
+                    # The peer closed the pooled connection (restart, idle
+                    # close) before answering anything: resend once on a
+                    # fresh connection. Partly answered batches are never
+                    # resent, as forwarded PUT/DELETE are not idempotent
+                    conn[1].close()
+                    lines = None
+
+            if lines is None:
+                conn = await self._open_connection(host, port, timeout)
+                lines = await self._roundtrip(conn, payload, count, timeout)
+
+            if len(lines) == count:
+                self._release(address, conn)
+            else:
+                conn[1].close()
+
+            # Parse responses; missing ones mean the node closed early
+            responses = [self._parse_response(line.decode().strip()) for line in lines]
+            responses.extend(Response.error("empty response from node") for _ in range(count - len(lines)))
+            return responses
+
         except asyncio.TimeoutError:
             logger.error(f"Timeout connecting to {host}:{port}")
-            return Response.error("connection timeout")
+            return [Response.error("connection timeout")] * count
         except Exception as e:
             logger.error(f"Error sending command to {host}:{port}: {e}")
-            return Response.error(f"connection error: {e}")
-    
+            return [Response.error(f"connection error: {e}")] * count
+
+    async def _open_connection(self, host: str, port: int, timeout: float):
+        """
+        Open a new connection to a peer.
+
+        The first connection resolves host normally; later ones dial the IP
+        that worked. If that fails (e.g. a restarted container came back
+        at a new address), the host is resolved again on the next attempt.
+        """
+        # asyncio and uvloop both enable TCP_NODELAY on new TCP
+        # transports, so pooled connections never wait on Nagle
+        ip = self._resolved.get(host)
+        try:
+            conn = await asyncio.wait_for(
+                asyncio.open_connection(ip or host, port),
+                timeout=timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            self._resolved.pop(host, None)
+            raise
+
+        if ip is None:
+            peer = conn[1].get_extra_info('peername')
+            if peer:
+                self._resolved[host] = peer[0]
+        return conn
+
+    @staticmethod
+    async def _roundtrip(conn, payload: bytes, count: int, timeout: float) -> List[bytes]:
+        """
+        Send payload on conn and read up to count response lines.
+
+        Returns fewer lines if the peer closes or resets the connection
+        first. The connection is closed on any error, as it may be left
+        with a partial command or unread responses.
+        """
+        reader, writer = conn[0], conn[1]
+        lines: List[bytes] = []
+
+        async def read_lines() -> None:
+            while len(lines) < count:
+                line = await reader.readline()
+                if not line:
+                    break
+                lines.append(line)
+
+        try:
+            writer.write(payload)
+            await writer.drain()
+            await asyncio.wait_for(read_lines(), timeout=timeout)
+        except ConnectionError:
+            # Like EOF: keep the responses that arrived before the reset
+            writer.close()
+        except BaseException:
+            writer.close()
+            raise
+        return lines
+
+    def _take_idle(self, address: Tuple[str, int]) -> Optional[_PooledConnection]:
+        """Pop the most recently used live idle connection to address, if any."""
+        idle = self._idle.get(address)
+        if not idle:
+            return None
+
+        expired_before = time.monotonic() - self.idle_timeout
+        while idle:
+            conn = idle.pop()
+            reader, writer, last_used = conn
+            if last_used >= expired_before and not writer.is_closing() and not reader.at_eof():
+                return conn
+            writer.close()
+        return None
+
+    def _release(self, address: Tuple[str, int], conn: _PooledConnection) -> None:
+        """Return a connection to the idle pool, or close it if the pool is full."""
+        reader, writer = conn[0], conn[1]
+        idle = self._idle.get(address)
+        if idle is None:
+            idle = self._idle[address] = deque()
+
+        if len(idle) < self.pool_size and not writer.is_closing():
+            idle.append((reader, writer, time.monotonic()))
+        else:
+            writer.close()
+
+    async def close(self) -> None:
+        """Close all idle peer connections."""
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _, writer, _ in conns:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except Exception:
+                    pass
+
     def _format_command(self, command: Command) -> str:
         """
         Format a command for sending over the wire.
@@ -187,24 +408,10 @@ class ClusterRouter:
         Returns:
             Formatted command string with newline
         """
-        if command.type == CommandType.PUT:
-            if command.ttl > 0:
-                return f"PUT {command.key} {command.value} {command.ttl}\n"
-            return f"PUT {command.key} {command.value}\n"
-        elif command.type == CommandType.GET:
-            return f"GET {command.key}\n"
-        elif command.type == CommandType.DELETE:
-            return f"DELETE {command.key}\n"
-        elif command.type == CommandType.EXISTS:
-            return f"EXISTS {command.key}\n"
-        elif command.type == CommandType.REPL_PUT:
-            if command.ttl > 0:
-                return f"REPL_PUT {command.key} {command.value} {command.ttl}\n"
-            return f"REPL_PUT {command.key} {command.value}\n"
-        elif command.type == CommandType.REPL_DELETE:
-            return f"REPL_DELETE {command.key}\n"
-        else:
+        formatter = _COMMAND_FORMATTERS.get(command.type)
+        if formatter is None:
             return command.raw + "\n"
+        return formatter(command)
     
     def _parse_response(self, response_str: str) -> Response:
         """
@@ -9,9 +9,9 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Server configuration settings."""
+    """Server configuration settings (read-only once loaded)."""
 
     # Network settings
     HOST: str = os.environ.get("KV_CACHE_HOST", "0.0.0.0")
@@ -21,15 +21,34 @@ class Settings:
     MAX_KEYS: int = int(os.environ.get("KV_CACHE_MAX_KEYS", "10000"))
     MAX_KEY_LENGTH: int = 256
     MAX_VALUE_LENGTH: int = 256
+    STORE_SHARDS: int = int(os.environ.get("KV_CACHE_SHARDS", "1"))  # 1 = unsharded KVStore
 
     # TTL settings
     DEFAULT_TTL: int = 0  # 0 means no expiration
+    # False selects a store without expiry checks; TTL arguments are then ignored
+    TTL_ENABLED: bool = os.environ.get("KV_CACHE_TTL_ENABLED", "true").lower() == "true"
     CLEANUP_INTERVAL: int = 60  # Seconds between active cleanup runs
 
     # Connection settings
     MAX_CONNECTIONS: int = 1000
     READ_BUFFER_SIZE: int = 4096
+    RECV_BUFFER_SIZE: int = 65536  # Socket read size; one buffer shared by all connections
+    WRITE_BATCH_SIZE: int = 16384  # Bytes of pipelined responses sent in one write
     CONNECTION_TIMEOUT: int = 300  # Seconds before idle connection is closed
+    # Server processes sharing the port via SO_REUSEPORT (Linux/BSD). Each
+    # has its own store, so keys are only visible to connections that the
+    # kernel assigns to the process holding them
+    WORKERS: int = int(os.environ.get("KV_CACHE_WORKERS", "1"))
+    USE_UVLOOP: bool = os.environ.get("KV_CACHE_UVLOOP", "true").lower() == "true"  # If installed
+    # Idle connections kept open per peer node for forwarding/replication
+    CLUSTER_POOL_SIZE: int = int(os.environ.get("KV_CACHE_CLUSTER_POOL_SIZE", "8"))
+    # "sync": a write is acknowledged after the replica confirms it.
+    # "async": acknowledged after the local write; replicated in the background
+    REPLICATION_MODE: str = os.environ.get("KV_CACHE_REPLICATION_MODE", "sync").lower()
+    REPLICATION_WORKERS: int = int(os.environ.get("KV_CACHE_REPLICATION_WORKERS", "4"))
+    REPLICATION_QUEUE_SIZE: int = 10000  # Pending writes per worker before PUTs wait
+    REPLICATION_BATCH_SIZE: int = 64  # Max queued writes a worker sends in one batch
+    REPLICATION_DRAIN_TIMEOUT: float = 5.0  # Seconds stop() waits for pending writes
 
     # Logging settings
     DEBUG: bool = os.environ.get("KV_CACHE_DEBUG", "false").lower() == "true"
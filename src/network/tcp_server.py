@@ -16,14 +16,23 @@ Key asyncio concepts needed:
 
 import asyncio
 import logging
+import socket
 from asyncio import StreamReader, StreamWriter
-from typing import Optional
+from typing import Dict, List, Optional
 
 from ..cache.store import KVStore
-from ..cluster.config import ClusterConfig
+from ..cluster.config import ClusterConfig, KeyRoute, get_shard_for_key
 from ..cluster.router import ClusterRouter
 from ..config.settings import settings
-from ..protocol.commands import CommandType, Response
+from ..protocol.commands import (
+    DELETED,
+    EXISTS_FALSE,
+    EXISTS_TRUE,
+    KEY_NOT_FOUND,
+    STORED,
+    CommandType,
+    Response,
+)
 from ..protocol.parser import ProtocolParser
 
 # Configure logging
@@ -33,6 +42,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Command types as module globals, compared with `is` (members are
+# singletons; == would go through Enum.__eq__)
+_PUT = CommandType.PUT
+_GET = CommandType.GET
+_DELETE = CommandType.DELETE
+_EXISTS = CommandType.EXISTS
+_QUIT = CommandType.QUIT
+_REPL_PUT = CommandType.REPL_PUT
+_REPL_DELETE = CommandType.REPL_DELETE
+
+# Internal commands executed locally without routing or replication
+_REPLICATION_COMMANDS = (_REPL_PUT, _REPL_DELETE)
+
+REPLICATION_MODES = ("sync", "async")
+
+# Marker returned by _execute_command for keys another node owns
+_FORWARD_TO_PRIMARY = Response.error("FORWARD_TO_PRIMARY")
+
+
+async def _skip_line(reader: StreamReader) -> None:
+    """Discard the rest of a line over the reader's limit, through its newline."""
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as exc:
+            await reader.readexactly(exc.consumed)
+        except asyncio.IncompleteReadError:
+            return  # EOF; the next read reports the disconnect
+
+
+def _has_buffered_line(reader: StreamReader) -> bool:
+    """
+    Whether reader already holds another complete line.
+
+    StreamReader has no public way to peek, so this reads its private
+    _buffer: the bytearray of received but not yet consumed data, which
+    readuntil() consumes from (CPython asyncio.streams).
+    """
+    return b"\n" in reader._buffer
+
+
+class _BufferedStreamReaderProtocol(asyncio.StreamReaderProtocol, asyncio.BufferedProtocol):
+    """
+    StreamReaderProtocol that receives into a preallocated buffer.
+
+    The event loop reads into the buffer (recv_into) instead of allocating
+    a new bytes object per read, and buffer_updated() copies the data into
+    the connection's StreamReader. That copy finishes before the loop reads
+    any other socket, so one buffer can be shared by every connection.
+
+    uvloop only uses get_buffer() for protocols that are not
+    asyncio.Protocol subclasses, so there it keeps calling data_received()
+    (with bytes from its own read buffer); behaviour is the same.
+    """
+
+    def __init__(self, stream_reader, client_connected_cb, recv_buffer: memoryview, loop=None):
+        super().__init__(stream_reader, client_connected_cb, loop=loop)
+        self._recv_buffer = recv_buffer
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.data_received(self._recv_buffer[:nbytes])
+
 
 class KVServer:
     """
@@ -65,6 +140,8 @@ class KVServer:
             port: int = None,
             store: KVStore = None,
             cluster_config: ClusterConfig = None,
+            replication_mode: str = None,
+            reuse_port: bool = False,
     ):
         """
         Initialize the server.
@@ -74,21 +151,44 @@ class KVServer:
             port: Port number (default from settings)
             store: KVStore instance (creates new one if not provided)
             cluster_config: ClusterConfig instance for clustering support
+            replication_mode: "sync" to acknowledge writes after the replica
+                has applied them, "async" to acknowledge after the local write
+                and replicate in the background (default from settings)
+            reuse_port: Bind with SO_REUSEPORT so several processes can
+                listen on the same port (see src/server.py --workers)
+
+        Raises:
+            ValueError: If replication_mode is not "sync" or "async"
         """
         self.host = host if host is not None else settings.HOST
         self.port = port if port is not None else settings.PORT
+        self.reuse_port = reuse_port
         self.store = store if store is not None else KVStore()
         self.parser = ProtocolParser()
         
         # Clustering support
         self.cluster_config = cluster_config
         self.router = ClusterRouter(cluster_config) if cluster_config else None
+        self.replication_mode = replication_mode if replication_mode is not None else settings.REPLICATION_MODE
+        if self.replication_mode not in REPLICATION_MODES:
+            raise ValueError(f"replication_mode must be one of {REPLICATION_MODES}")
+
+        # Async replication: one queue per worker, chosen by key hash so
+        # writes to the same key reach the replica in order
+        self._replication_queues: List[asyncio.Queue] = []
+        self._replication_workers: List[asyncio.Task] = []
 
         # Server state
         self._server: Optional[asyncio.Server] = None
+        self._serve_task: Optional[asyncio.Task] = None
         self._running = False
         self._connection_count = 0
         self._total_requests = 0
+        # Open connections by handle_client task, closed by stop(); peer
+        # nodes keep pooled connections open, so these need not end on their own
+        self._clients: Dict[asyncio.Task, StreamWriter] = {}
+
+        self._build_dispatch()
 
     async def handle_client(
             self,
@@ -122,71 +222,199 @@ class KVServer:
         """
         addr = writer.get_extra_info('peername')
         self._connection_count += 1
-        logger.debug(f"Client connected: {addr}")
-
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        logger.debug("Client connected: %s", addr)
+
+        # The server never writes to an idle client, so without keepalive a
+        # client that vanished (crash, dropped link) would hold its
+        # connection forever. TCP_NODELAY is already set by the event loop.
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        readuntil = reader.readuntil
+        # Responses to pipelined commands are collected and sent in one
+        # write once no further complete command is buffered (or the batch
+        # reaches WRITE_BATCH_SIZE). Whatever is still collected when the
+        # loop ends, normally or by an exception, is written before closing.
+        batch_limit = settings.WRITE_BATCH_SIZE
+        pending: List[bytes] = []
+        pending_size = 0
+        # drain() only does work once the transport has buffered output the
+        # socket did not take, so skip the await while the buffer is empty
+        write_buffer_size = writer.transport.get_write_buffer_size
         try:
             while True:
-                data = await reader.readline()
-                if not data:
-                    # Client disconnected
-                    logger.debug(f"Client disconnected: {addr}")
-                    break
-
+                # readuntil() directly: readline() is a wrapper around it
                 try:
-                    raw = data.decode().rstrip('\r\n')
-                except UnicodeDecodeError:
-                    response = Response.error("invalid encoding")
-                    writer.write(self.parser.format_response(response).encode())
-                    await writer.drain()
-                    continue
-
-                command = self.parser.parse_request(raw)
-
-                if command.type == CommandType.QUIT:
-                    logger.debug(f"Client requested quit: {addr}")
-                    break
-
-                if not command.is_valid:
+                    data = await readuntil(b"\n")
+                except asyncio.IncompleteReadError as exc:
+                    # EOF; a final line without a newline is still handled
+                    data = exc.partial
+                except asyncio.LimitOverrunError:
+                    # Longer than READ_BUFFER_SIZE, so not a valid command:
+                    # skip it rather than close with input unread (the reset
+                    # that causes would discard responses already written)
+                    await _skip_line(reader)
+                    data = None
+
+                if data is None:
                     response = Response.error("invalid command")
+                elif not data:
+                    # Client disconnected
+                    logger.debug("Client disconnected: %s", addr)
+                    break
                 else:
-                    self._total_requests += 1
-                    response = self._execute_command(command)
+                    try:
+                        # parse_request() strips the line ending itself
+                        raw = data.decode()
+                    except UnicodeDecodeError:
+                        response = Response.error("invalid encoding")
+                    else:
+                        command = self.parser.parse_request(raw)
+
+                        if command.type is _QUIT:
+                            logger.debug("Client requested quit: %s", addr)
+                            break
+
+                        if not command.is_valid:
+                            response = Response.error("invalid command")
+                        else:
+                            self._total_requests += 1
+
+                            # Hash the key once per client command; internal
+                            # replication commands are never routed
+                            route = None
+                            if self.cluster_config and command.type not in _REPLICATION_COMMANDS:
+                                route = self.cluster_config.route(command.key)
+
+                            response = self._execute_command(command, route)
                     
-                    # Handle forwarding if needed (clustered mode)
-                    if response.message == "FORWARD_TO_PRIMARY" and self.router:
-                        response = await self.router.forward_to_primary(command)
+                            # Handle forwarding if needed (clustered mode)
+                            if response is _FORWARD_TO_PRIMARY and self.router:
+                                response = await self.router.forward_to_primary(command, route.primary_addr)
                     
-                    # Handle replication for successful writes (primary only)
-                    elif self.cluster_config and self.cluster_config.is_primary_for_key(command.key):
-                        if command.type == CommandType.PUT and response.message == "stored":
-                            # Replicate and require success before returning OK
-                            repl_success = await self.router.replicate_put(command.key, command.value, command.ttl)
-                            if not repl_success:
-                                logger.warning(f"Replication failed for PUT {command.key}")
-                                response = Response.error("replication failed")
-
-                        elif command.type == CommandType.DELETE and response.message == "deleted":
-                            # Replicate delete and require success
-                            repl_success = await self.router.replicate_delete(command.key)
-                            if not repl_success:
-                                logger.warning(f"Replication failed for DELETE {command.key}")
-                                response = Response.error("replication failed")
-
-                writer.write(self.parser.format_response(response).encode())
-                await writer.drain()
+                            # Handle replication for successful writes (primary only)
+                            elif route is not None and route.is_primary:
+                                if self._replication_queues:
+                                    if response.message in ("stored", "deleted"):
+                                        # Acknowledge now; a worker replicates it
+                                        queues = self._replication_queues
+                                        await queues[hash(command.key) % len(queues)].put((command, route.replica_addr))
+
+                                elif command.type is _PUT and response.message == "stored":
+                                    # Replicate and require success before returning OK
+                                    repl_success = await self.router.replicate_put(
+                                        command.key, command.value, command.ttl, route.replica_addr
+                                    )
+                                    if not repl_success:
+                                        logger.warning(f"Replication failed for PUT {command.key}")
+                                        response = Response.error("replication failed")
+
+                                elif command.type is _DELETE and response.message == "deleted":
+                                    # Replicate delete and require success
+                                    repl_success = await self.router.replicate_delete(command.key, route.replica_addr)
+                                    if not repl_success:
+                                        logger.warning(f"Replication failed for DELETE {command.key}")
+                                        response = Response.error("replication failed")
+
+                # Fixed responses carry their wire bytes; format the rest
+                encoded = response.encoded
+                if encoded is None:
+                    encoded = self.parser.format_response(response).encode()
+                pending.append(encoded)
+                pending_size += len(encoded)
+                if pending_size < batch_limit and _has_buffered_line(reader):
+                    continue
+
+                writer.write(b"".join(pending) if len(pending) > 1 else encoded)
+                pending.clear()
+                pending_size = 0
+                if write_buffer_size():
+                    await writer.drain()
 
         except ConnectionResetError:
-            logger.debug(f"Connection reset by client: {addr}")
+            logger.debug("Connection reset by client: %s", addr)
         except Exception as exc:  # Log unexpected errors but keep server alive
             logger.exception(f"Error handling client {addr}: {exc}")
         finally:
+            self._clients.pop(task, None)
             try:
+                if pending:
+                    # Answer everything read before QUIT, EOF or an error
+                    # (e.g. a later line over the read limit)
+                    writer.write(b"".join(pending))
                 writer.close()
                 await writer.wait_closed()
             except Exception:
                 pass
 
-    def _execute_command(self, command) -> Response:
+    async def _replication_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Replicate queued (command, replica_addr) writes until a None item.
+
+        Whatever has queued up while the previous batch was in flight (up
+        to REPLICATION_BATCH_SIZE) is sent as one pipelined batch per
+        replica, so a busy primary makes one write per batch, not per key.
+        """
+        router = self.router
+        batch_size = max(1, settings.REPLICATION_BATCH_SIZE)
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            stopping = None in batch
+            if stopping:
+                batch = batch[:batch.index(None)]
+
+            by_replica: Dict[tuple, list] = {}
+            for command, address in batch:
+                by_replica.setdefault(address, []).append(command)
+
+            for address, commands in by_replica.items():
+                results = await router.replicate_batch(commands, address)
+                for command, ok in zip(commands, results):
+                    if not ok:
+                        logger.warning(f"Async replication failed for {command.type.name} {command.key}")
+
+            if stopping:
+                return
+
+    def _start_replication(self) -> None:
+        """Start the async replication workers (async mode, clustered only)."""
+        if self.replication_mode != "async" or not self.router or self._replication_workers:
+            return
+
+        workers = max(1, settings.REPLICATION_WORKERS)
+        self._replication_queues = [
+            asyncio.Queue(maxsize=settings.REPLICATION_QUEUE_SIZE) for _ in range(workers)
+        ]
+        self._replication_workers = [
+            asyncio.create_task(self._replication_worker(queue))
+            for queue in self._replication_queues
+        ]
+
+    async def _stop_replication(self) -> None:
+        """Let workers drain pending writes (bounded by a timeout), then stop them."""
+        queues, self._replication_queues = self._replication_queues, []
+        workers, self._replication_workers = self._replication_workers, []
+        if not workers:
+            return
+
+        # A worker whose queue is full is still busy and is cancelled below
+        for queue in queues:
+            if not queue.full():
+                queue.put_nowait(None)
+        done, pending = await asyncio.wait(workers, timeout=settings.REPLICATION_DRAIN_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"Stopped with unreplicated writes pending on {len(pending)} worker(s)")
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _execute_command(self, command, route: Optional[KeyRoute] = None) -> Response:
         """
         Execute a parsed command on the store.
 
@@ -198,88 +426,86 @@ class KVServer:
         - Primary replicates writes to replica
         - Replication commands are executed locally
 
+        Handlers are looked up in the tables built by _build_dispatch():
+        one for local execution, and one per ownership (forwarding or
+        primary) for client commands in clustered mode.
+
         Args:
             command: The Command object to execute
+            route: ClusterConfig.route() for the command's key, if the caller
+                already computed it (clustered mode only)
 
         Returns:
             Response object with the result
         """
-        # Handle replication commands (internal only - never forward)
-        if command.type == CommandType.REPL_PUT:
-            self.store.put(command.key, command.value, ttl=command.ttl)
-            return Response.stored()
-        
-        if command.type == CommandType.REPL_DELETE:
-            deleted = self.store.delete(command.key)
-            return Response.deleted() if deleted else Response.key_not_found()
-        
-        # If clustering is disabled, execute locally
-        if not self.cluster_config:
-            return self._execute_local(command)
-        
-        # Client commands - may need forwarding
-        if command.type in (CommandType.PUT, CommandType.DELETE):
-            # Check if this node is the primary
-            if not self.cluster_config.is_primary_for_key(command.key):
-                # Forward to primary
-                logger.debug(f"Forwarding {command.type.name} {command.key} to primary")
-                # Use asyncio to forward (we'll handle this in handle_client)
-                return Response.error("FORWARD_TO_PRIMARY")
-            
-            # This node is primary - execute and replicate
-            if command.type == CommandType.PUT:
-                # Store locally
-                self.store.put(command.key, command.value, ttl=command.ttl)
-                # Replicate to replica (will be done async in handle_client)
-                return Response.stored()
-            
-            if command.type == CommandType.DELETE:
-                # Delete locally
-                deleted = self.store.delete(command.key)
-                if deleted:
-                    # Replicate delete (will be done async in handle_client)
-                    return Response.deleted()
-                return Response.key_not_found()
-        
-        # GET and EXISTS can be handled locally or forwarded
-        if command.type == CommandType.GET:
-            if not self.cluster_config.is_primary_for_key(command.key):
-                # Forward to primary
-                logger.debug(f"Forwarding GET {command.key} to primary")
-                return Response.error("FORWARD_TO_PRIMARY")
-            
-            value = self.store.get(command.key)
-            return Response.value_response(value) if value is not None else Response.key_not_found()
-        
-        if command.type == CommandType.EXISTS:
-            if not self.cluster_config.is_primary_for_key(command.key):
-                logger.debug(f"Forwarding EXISTS {command.key} to primary")
-                return Response.error("FORWARD_TO_PRIMARY")
-            
-            exists = self.store.exists(command.key)
-            return Response.exists_response(exists)
-        
-        return Response.error("invalid command")
-    
+        if route is not None:
+            table = self._cluster_dispatch[route.is_primary]
+        elif self.cluster_config is None or command.type in _REPLICATION_COMMANDS:
+            # Replication commands are internal only - never routed
+            table = self._local_dispatch
+        else:
+            route = self.cluster_config.route(command.key)
+            table = self._cluster_dispatch[route.is_primary]
+
+        handler = table.get(command.type)
+        if handler is None:
+            return Response.error("invalid command")
+        return handler(command)
+
     def _execute_local(self, command) -> Response:
         """Execute command locally (non-clustered mode)."""
-        if command.type == CommandType.PUT:
-            self.store.put(command.key, command.value, ttl=command.ttl)
-            return Response.stored()
+        if command.type in _REPLICATION_COMMANDS:
+            return Response.error("invalid command")
+        return self._execute_command(command)
+
+    def _build_dispatch(self) -> None:
+        """
+        Build the command handler tables used by _execute_command().
+
+        _local_dispatch maps every executable command type to its store
+        handler. _cluster_dispatch is indexed by route.is_primary: the
+        primary executes client commands locally, other nodes answer
+        FORWARD_TO_PRIMARY for handle_client to forward. Replication
+        commands run locally in every table.
+        """
+        client = {
+            _PUT: self._handle_put,
+            _GET: self._handle_get,
+            _DELETE: self._handle_delete,
+            _EXISTS: self._handle_exists,
+        }
+        replication = {
+            _REPL_PUT: self._handle_put,
+            _REPL_DELETE: self._handle_delete,
+        }
+        forward = dict.fromkeys(client, self._handle_forward)
+
+        self._local_dispatch = {**client, **replication}
+        self._cluster_dispatch = ({**forward, **replication}, self._local_dispatch)
 
-        if command.type == CommandType.GET:
-            value = self.store.get(command.key)
-            return Response.value_response(value) if value is not None else Response.key_not_found()
+    def _handle_put(self, command) -> Response:
+        """Store a PUT or REPL_PUT locally."""
+        self.store.put(command.key, command.value, ttl=command.ttl)
+        return STORED
 
-        if command.type == CommandType.DELETE:
-            deleted = self.store.delete(command.key)
-            return Response.deleted() if deleted else Response.key_not_found()
+    def _handle_get(self, command) -> Response:
+        """Look up a GET locally."""
+        value = self.store.get(command.key)
+        return Response.value_response(value) if value is not None else KEY_NOT_FOUND
 
-        if command.type == CommandType.EXISTS:
-            exists = self.store.exists(command.key)
-            return Response.exists_response(exists)
+    def _handle_delete(self, command) -> Response:
+        """Apply a DELETE or REPL_DELETE locally."""
+        return DELETED if self.store.delete(command.key) else KEY_NOT_FOUND
 
-        return Response.error("invalid command")
+    def _handle_exists(self, command) -> Response:
+        """Check an EXISTS locally."""
+        return EXISTS_TRUE if self.store.exists(command.key) else EXISTS_FALSE
+
+    def _handle_forward(self, command) -> Response:
+        """Mark a client command owned by another node for forwarding."""
+        # handle_client does the (async) forwarding itself
+        logger.debug("Forwarding %s %s to primary", command.type.name, command.key)
+        return _FORWARD_TO_PRIMARY
 
     async def start(self) -> None:
         """
@@ -290,7 +516,8 @@ class KVServer:
         or within an existing event loop.
 
         Implementation:
-        - Use asyncio.start_server() with self.handle_client as callback
+        - Like asyncio.start_server() with self.handle_client as callback,
+          but with a protocol that reads into a shared buffer
         - Log the server address when started
         - Use server.serve_forever() to run indefinitely
 
@@ -301,13 +528,26 @@ class KVServer:
         if self._running:
             return
 
-        self._server = await asyncio.start_server(
-            self.handle_client,
+        # Accepted sockets get TCP_NODELAY from the event loop (asyncio and
+        # uvloop alike). Socket buffers are left to kernel autotuning, which
+        # already starts above 64 KiB; a fixed SO_SNDBUF would cap it.
+        loop = asyncio.get_running_loop()
+        limit = settings.READ_BUFFER_SIZE
+        recv_buffer = memoryview(bytearray(settings.RECV_BUFFER_SIZE))
+
+        def protocol_factory():
+            reader = asyncio.StreamReader(limit=limit, loop=loop)
+            return _BufferedStreamReaderProtocol(reader, self.handle_client, recv_buffer, loop=loop)
+
+        self._server = await loop.create_server(
+            protocol_factory,
             self.host,
             self.port,
-            limit=settings.READ_BUFFER_SIZE,
+            reuse_port=self.reuse_port,
         )
         self._running = True
+        self._serve_task = asyncio.current_task()
+        self._start_replication()
 
         addrs = ', '.join(str(sock.getsockname()) for sock in self._server.sockets or [])
         logger.info(f"Serving on {addrs}")
@@ -325,17 +565,32 @@ class KVServer:
         """
         Stop the server gracefully.
 
-        Closes the server and waits for it to fully shut down.
+        Closes the server and waits for it to fully shut down. In async
+        replication mode, pending writes get REPLICATION_DRAIN_TIMEOUT
+        seconds to reach the replica.
         """
         if self._server is None:
             return
 
         self._server.close()
         try:
+            # Closing the transport ends the handler's read loop at EOF
+            for writer in self._clients.values():
+                writer.close()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._stop_replication()
+            # Close pooled peer connections before waiting on our own: peers
+            # shutting down at the same time may be waiting for them to go away
+            if self.router:
+                await self.router.close()
             await self._server.wait_closed()
         finally:
             self._server = None
             self._running = False
+            # asyncio's Server.close() ends serve_forever(); uvloop's does not
+            serve_task, self._serve_task = self._serve_task, None
+            if serve_task is not None and serve_task is not asyncio.current_task():
+                serve_task.cancel()
 
     def is_running(self) -> bool:
         """Check if the server is currently running."""
@@ -349,7 +604,7 @@ class KVServer:
             Dictionary with server stats including connection counts,
             request counts, and store statistics.
         """
-        return {
+        stats = {
             "running": self._running,
             "host": self.host,
             "port": self.port,
@@ -357,20 +612,27 @@ class KVServer:
             "total_requests": self._total_requests,
             "store_stats": self.store.get_stats(),
         }
+        if self.cluster_config:
+            stats["shard_cache"] = get_shard_for_key.cache_info()._asdict()
+        return stats
 
 
-async def run_server(host: str = None, port: int = None) -> None:
+async def run_server(host: str = None, port: int = None, reuse_port: bool = False) -> None:
     """
     Convenience function to create and run the server.
 
     Args:
         host: Bind address (default from settings)
         port: Port number (default from settings)
+        reuse_port: Bind with SO_REUSEPORT, for running one server per
+            forked worker process on the same port (each with its own store;
+            see src/server.py --workers)
 
     Usage:
         asyncio.run(run_server(port=7171))
+        uvloop.run(run_server(port=7171))  # same, on uvloop
     """
-    server = KVServer(host=host, port=port)
+    server = KVServer(host=host, port=port, reuse_port=reuse_port)
 
     try:
         await server.start()
@@ -5,8 +5,9 @@ This module defines the data structures for protocol commands and responses.
 Students should NOT modify this file.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Optional
 
 
@@ -22,6 +23,17 @@ class CommandType(Enum):
     REPL_PUT = auto()
     REPL_DELETE = auto()
 
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent with equality; it runs in C, unlike Enum.__hash__, which
+    # keeps dispatch tables keyed by command type cheap
+    __hash__ = object.__hash__
+
+
+# Argument requirements used by Command.is_valid
+_KEY_COMMANDS = frozenset((CommandType.GET, CommandType.DELETE, CommandType.EXISTS, CommandType.REPL_DELETE))
+_KEY_VALUE_COMMANDS = frozenset((CommandType.PUT, CommandType.REPL_PUT))
+_QUIT = CommandType.QUIT
+
 
 class ResponseStatus(Enum):
     """Enumeration of response statuses."""
@@ -29,11 +41,14 @@ class ResponseStatus(Enum):
     ERROR = "ERROR"
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """
     Represents a parsed protocol command.
 
+    Fields are stored as given; the parser always passes strings (and ""
+    for arguments a command does not take).
+
     Attributes:
         type: The type of command (PUT, GET, DELETE, EXISTS, QUIT, UNKNOWN)
         key: The key for the operation (may be empty for QUIT)
@@ -47,24 +62,16 @@ class Command:
     ttl: int = 0
     raw: str = ""
 
-    def __post_init__(self):
-        """Validate command after initialization."""
-        # Ensure key and value are strings
-        self.key = str(self.key) if self.key else ""
-        self.value = str(self.value) if self.value else ""
-
     @property
     def is_valid(self) -> bool:
         """Check if the command is valid for its type."""
-        if self.type == CommandType.UNKNOWN:
-            return False
-        if self.type == CommandType.QUIT:
-            return True
-        if self.type in (CommandType.GET, CommandType.DELETE, CommandType.EXISTS, CommandType.REPL_DELETE):
+        command_type = self.type
+        if command_type in _KEY_COMMANDS:
             return bool(self.key)
-        if self.type in (CommandType.PUT, CommandType.REPL_PUT):
+        if command_type in _KEY_VALUE_COMMANDS:
             return bool(self.key) and bool(self.value)
-        return False
+        # UNKNOWN is never valid; QUIT takes no arguments
+        return command_type is _QUIT
 
 
 @dataclass
@@ -76,10 +83,14 @@ class Response:
         status: OK or ERROR
         message: Response message or error description
         value: The value returned (for GET operations)
+        encoded: The complete wire line as bytes for fixed responses
+            (stored, deleted, key not found, exists 0/1) and values, so
+            the server can write it without formatting; None otherwise
     """
     status: ResponseStatus
     message: str = ""
     value: Optional[str] = None
+    encoded: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def ok(cls, message: str = "", value: Optional[str] = None) -> "Response":
@@ -94,24 +105,46 @@ class Response:
     @classmethod
     def stored(cls) -> "Response":
         """Create a 'stored' response for PUT operations."""
-        return cls.ok(message="stored")
+        return cls(ResponseStatus.OK, "stored", None, b"OK stored\n")
 
     @classmethod
     def deleted(cls) -> "Response":
         """Create a 'deleted' response for DELETE operations."""
-        return cls.ok(message="deleted")
+        return cls(ResponseStatus.OK, "deleted", None, b"OK deleted\n")
 
     @classmethod
     def key_not_found(cls) -> "Response":
         """Create a 'key not found' error response."""
-        return cls.error(message="key not found")
+        return cls(ResponseStatus.ERROR, "key not found", None, b"ERROR key not found\n")
 
     @classmethod
     def exists_response(cls, exists: bool) -> "Response":
         """Create an EXISTS response."""
-        return cls.ok(message="1" if exists else "0")
+        if exists:
+            return cls(ResponseStatus.OK, "1", None, b"OK 1\n")
+        return cls(ResponseStatus.OK, "0", None, b"OK 0\n")
 
     @classmethod
     def value_response(cls, value: str) -> "Response":
         """Create a GET response with a value."""
-        return cls.ok(value=value)
+        # Encoded here in one step; ProtocolParser.format_response()
+        # produces the same line (an empty value has no separator space)
+        encoded = _encode_value(value) if value else None
+        return cls(ResponseStatus.OK, "", value, encoded)
+
+
+# Hot keys return the same value over and over; a hit skips the format and
+# utf-8 encode. Values are capped at MAX_VALUE_LENGTH, so the cache stays small.
+@lru_cache(maxsize=1024)
+def _encode_value(value: str) -> bytes:
+    """Encode the response line for a GET value."""
+    return f"OK {value}\n".encode()
+
+
+# Shared instances of the fixed responses for hot paths that would otherwise
+# build an identical Response per request. Treat them as read-only.
+STORED = Response.stored()
+DELETED = Response.deleted()
+KEY_NOT_FOUND = Response.key_not_found()
+EXISTS_TRUE = Response.exists_response(True)
+EXISTS_FALSE = Response.exists_response(False)
@@ -8,10 +8,33 @@ Students must implement:
 - format_response(): Format a Response object into a protocol string
 """
 
+from typing import Iterable, List, Union
+
 from .commands import Command, CommandType, Response
 from ..config.settings import settings
 
 
+def _case_variants(keywords: dict) -> dict:
+    """Map each keyword in upper, lower and title case to its value."""
+    return {
+        variant: value
+        for keyword, value in keywords.items()
+        for variant in (keyword, keyword.lower(), keyword.title())
+    }
+
+
+# Keywords are looked up in these tables as sent, so the usual spellings
+# ("GET", "get", "Get") need no .upper() call; other mixes fall back to it.
+# Single-key commands taken by parse_request()'s fast path
+_KEY_COMMANDS = _case_variants({
+    "GET": CommandType.GET,
+    "DELETE": CommandType.DELETE,
+    "EXISTS": CommandType.EXISTS,
+    "REPL_DELETE": CommandType.REPL_DELETE,
+})
+_PUT_KEYWORDS = frozenset(_case_variants({"PUT": None}))
+
+
 class ProtocolParser:
     """
     Parser for the KV-Cache text protocol.
@@ -37,6 +60,15 @@ class ProtocolParser:
         """Initialize the parser with constraints from settings."""
         self.max_key_length = settings.MAX_KEY_LENGTH
         self.max_value_length = settings.MAX_VALUE_LENGTH
+        self._parsers = _case_variants({
+            "PUT": self._parse_put,
+            "GET": self._parse_get,
+            "DELETE": self._parse_delete,
+            "EXISTS": self._parse_exists,
+            "REPL_PUT": self._parse_repl_put,
+            "REPL_DELETE": self._parse_repl_delete,
+            "QUIT": self._parse_quit,
+        })
 
     def parse_request(self, data: str) -> Command:
         """
@@ -68,32 +100,70 @@ class ProtocolParser:
             - Validate key/value length constraints
             - Handle errors gracefully (return UNKNOWN command)
         """
+        parts = data.split()
+
+        # Fast path for the bulk of traffic: GET/DELETE/EXISTS and PUT
+        # without TTL, already well-formed. Anything else (TTL, wrong arity,
+        # over-long fields, odd keyword case) takes the general path below,
+        # which returns the same Command for these inputs.
+        count = len(parts)
+        if count == 2:
+            command_type = _KEY_COMMANDS.get(parts[0])
+            if command_type is not None and len(parts[1]) <= self.max_key_length:
+                return Command(command_type, parts[1], "", 0, data.strip())
+        elif (count == 3 and parts[0] in _PUT_KEYWORDS
+                and len(parts[1]) <= self.max_key_length
+                and len(parts[2]) <= self.max_value_length):
+            return Command(CommandType.PUT, parts[1], parts[2], 0, data.strip())
+
         raw = data.strip()
         if not raw:
             return Command(type=CommandType.UNKNOWN, raw=raw)
 
-        parts = raw.split()
-        command_name = parts[0].upper()
-
-        if command_name == "PUT":
-            return self._parse_put(parts, raw)
-        if command_name == "GET":
-            return self._parse_get(parts, raw)
-        if command_name == "DELETE":
-            return self._parse_delete(parts, raw)
-        if command_name == "EXISTS":
-            return self._parse_exists(parts, raw)
-        if command_name == "REPL_PUT":
-            return self._parse_repl_put(parts, raw)
-        if command_name == "REPL_DELETE":
-            return self._parse_repl_delete(parts, raw)
-        if command_name == "QUIT":
-            # QUIT takes no args
-            if len(parts) == 1:
-                return Command(type=CommandType.QUIT, raw=raw)
-            return Command(type=CommandType.UNKNOWN, raw=raw)
+        parse = self._parsers.get(parts[0])
+        if parse is None:
+            # Keywords are case-insensitive; e.g. "pUt"
+            parse = self._parsers.get(parts[0].upper())
+            if parse is None:
+                return Command(type=CommandType.UNKNOWN, raw=raw)
+        return parse(parts, raw)
+
+    def parse_batch(self, data: Union[str, Iterable[str]]) -> List[Command]:
+        """
+        Parse many requests in one call.
+
+        Args:
+            data: Either an iterable of raw request strings, or a single
+                  newline-delimited buffer holding several requests
 
-        return Command(type=CommandType.UNKNOWN, raw=raw)
+        Returns:
+            List of Command objects, one per request, in input order.
+            Each entry is exactly what parse_request() would return.
+
+        Examples:
+            >>> parser = ProtocolParser()
+            >>> [c.type.name for c in parser.parse_batch("GET a\\nEXISTS b\\n")]
+            ['GET', 'EXISTS']
+        """
+        if isinstance(data, str):
+            # Split on "\n" only, like the server's reader; str.splitlines()
+            # would also split on "\x1c", "\u2028" etc. inside a request
+            data = data.split("\n")
+            if not data[-1]:
+                data.pop()
+
+        parse = self.parse_request
+        return [parse(line) for line in data]
+
+    def _parse_quit(self, parts: list, raw: str) -> Command:
+        """
+        Parse a QUIT command.
+
+        Format: QUIT (no arguments)
+        """
+        if len(parts) != 1:
+            return Command(type=CommandType.UNKNOWN, raw=raw)
+        return Command(type=CommandType.QUIT, raw=raw)
 
     def _parse_put(self, parts: list, raw: str) -> Command:
         """
@@ -10,11 +10,32 @@ Usage:
     python -m src.server --host 127.0.0.1   # Custom host
     python -m src.server --debug            # Enable debug logging
     python -m src.server --max-keys 5000    # Custom cache size
+    python -m src.server --shards 16        # Hash-sharded cache
+    python -m src.server --no-uvloop        # Stock asyncio loop
+    python -m src.server --workers 4        # 4 processes on one port
+
+uvloop is used as the event loop when installed (pip install -e .[perf]).
+
+With --workers N > 1 the server forks N-1 extra processes that listen on
+the same port with SO_REUSEPORT, and the kernel spreads new connections
+over them. Each process has its own store (no shared memory or locks), so
+a key is only visible to connections served by the process that stored
+it, and --max-keys applies per process. This suits clients that keep
+each key on one connection, or a cache that tolerates misses; use the
+cluster mode for one consistent key space. Cluster nodes (NODE_ID set)
+reject --workers > 1, since peers' replica writes would land in random
+processes.
 
 Environment Variables:
     KV_CACHE_HOST       - Server bind address
     KV_CACHE_PORT       - Server port
     KV_CACHE_MAX_KEYS   - Maximum cache size
+    KV_CACHE_SHARDS     - Number of cache shards (power of two; 1 = unsharded)
+    KV_CACHE_TTL_ENABLED - Set to false to use a store without TTL support
+                          (with --shards, every shard is then TTL-less)
+    KV_CACHE_REPLICATION_MODE - sync (default) or async replication in a cluster
+    KV_CACHE_UVLOOP     - Set to false to never use uvloop
+    KV_CACHE_WORKERS    - Number of server processes (default 1)
     KV_CACHE_DEBUG      - Enable debug mode (true/false)
 """
 
@@ -23,13 +44,22 @@ import asyncio
 import logging
 import os
 import signal
+import socket
 import sys
+from typing import List
 
-from .cache.store import KVStore
+from .cache.sharded import ShardedKVStore
+from .cache.store import KVStore, NoTTLKVStore
 from .cluster.config import ClusterConfig
 from .config.settings import settings
 from .network.tcp_server import KVServer
 
+# Optional uvloop event loop (Unix only; pip install -e .[perf])
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -59,13 +89,40 @@ def parse_args() -> argparse.Namespace:
         help="Maximum number of keys in cache",
     )
 
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=settings.STORE_SHARDS,
+        help="Split the cache into this many hash shards (power of two; 1 = unsharded)",
+    )
+
+    parser.add_argument(
+        "--no-uvloop",
+        dest="uvloop",
+        action="store_false",
+        default=settings.USE_UVLOOP,
+        help="Use the stock asyncio event loop even if uvloop is installed",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.WORKERS,
+        help="Server processes sharing the port via SO_REUSEPORT (each has its own store)",
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
         help="Enable debug logging",
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not (hasattr(socket, "SO_REUSEPORT") and hasattr(os, "fork")):
+        parser.error("--workers > 1 needs SO_REUSEPORT and os.fork, which this platform lacks")
+    return args
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -81,6 +138,39 @@ def setup_logging(debug: bool = False) -> None:
     )
 
 
+def fork_workers(count: int) -> List[int]:
+    """
+    Fork count worker processes.
+
+    Must run before the event loop and store are created, so each worker
+    builds its own.
+
+    Returns:
+        The workers' pids in the parent; an empty list in each worker
+    """
+    pids = []
+    for _ in range(count):
+        pid = os.fork()
+        if pid == 0:
+            return []
+        pids.append(pid)
+    return pids
+
+
+def stop_workers(pids: List[int]) -> None:
+    """Send SIGTERM to forked workers and wait for them to exit."""
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in pids:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
 def main() -> None:
     """Main entry point for the server."""
     args = parse_args()
@@ -96,6 +186,10 @@ def main() -> None:
     # Initialize cluster config if NODE_ID is set
     cluster_config = None
     if node_id > 0:
+        # The kernel would spread peers' forwarded writes and replica copies
+        # over the workers' separate stores, so a node must be one process
+        if args.workers > 1:
+            sys.exit("error: --workers > 1 is not supported in cluster mode (NODE_ID is set)")
         cluster_config = ClusterConfig(node_id)
         print(f'Node {node_id} starting on port {args.port}')
         print(f'  Primary for shards: {cluster_config.primary_shards}')
@@ -107,22 +201,31 @@ def main() -> None:
     setup_logging(debug=args.debug)
     logger = logging.getLogger(__name__)
 
+    # Extra server processes; each one continues from here on its own
+    workers = fork_workers(args.workers - 1) if args.workers > 1 else []
+
     # Create store with specified max size
-    store = KVStore(max_size=args.max_keys)
+    store_class = KVStore if settings.TTL_ENABLED else NoTTLKVStore
+    if args.shards > 1:
+        store = ShardedKVStore(max_size=args.max_keys, shards=args.shards, store_class=store_class)
+    else:
+        store = store_class(max_size=args.max_keys)
 
     # Create server with cluster config
     server = KVServer(
         host=args.host, 
         port=args.port, 
         store=store,
-        cluster_config=cluster_config
+        cluster_config=cluster_config,
+        reuse_port=args.workers > 1,
     )
 
     # Get or create event loop
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
+        use_uvloop = args.uvloop and uvloop is not None
+        loop = uvloop.new_event_loop() if use_uvloop else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
     # Setup signal handlers for graceful shutdown
@@ -135,11 +238,12 @@ def main() -> None:
         shutdown_event.set()
 
     # Register signal handlers (Unix only)
+    shutdown_tasks = []
     if sys.platform != 'win32':
         for sig in (signal.SIGTERM, signal.SIGINT):
             loop.add_signal_handler(
                 sig,
-                lambda s=sig: asyncio.create_task(shutdown(s))
+                lambda s=sig: shutdown_tasks.append(loop.create_task(shutdown(s)))
             )
 
     # Log startup info
@@ -147,11 +251,17 @@ def main() -> None:
     logger.info(f"  Host: {args.host}")
     logger.info(f"  Port: {args.port}")
     logger.info(f"  Max keys: {args.max_keys}")
+    logger.info(f"  Event loop: {type(loop).__module__.split('.')[0]}")
+    logger.info(f"  Workers: {args.workers} (pid {os.getpid()})")
     logger.info(f"  Debug: {args.debug}")
 
     # Run the server
     try:
         loop.run_until_complete(server.start())
+        # start() returns as soon as stop() closes the listener; let a
+        # signal-initiated stop() finish closing connections first
+        if shutdown_tasks:
+            loop.run_until_complete(asyncio.gather(*shutdown_tasks))
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
         loop.run_until_complete(server.stop())
@@ -165,6 +275,9 @@ def main() -> None:
         except Exception:
             pass
         loop.close()
+        # The parent stops its workers (a terminal's Ctrl+C reaches the
+        # whole process group anyway)
+        stop_workers(workers)
         logger.info("Server shutdown complete")
 
 
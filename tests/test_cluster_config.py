@@ -0,0 +1,84 @@
+"""
+Tests for the cluster's key placement
+
+These tests verify the shard mapping used by cluster nodes:
+- jump_back_hash only moves keys onto a newly added bucket
+- jump_back_hash spreads keys evenly over the buckets
+- ClusterConfig.route() agrees with the per-field lookups
+
+Run with: python -m pytest tests/test_cluster_config.py -v
+"""
+
+import random
+
+import pytest
+from src.cluster.config import NUM_NODES, ClusterConfig, KeyRoute, jump_back_hash
+
+
+def key_hashes(count: int):
+    """Fixed-seed 64-bit key hashes."""
+    rng = random.Random(1234)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+class TestJumpBackHash:
+    """Test the JumpBackHash bucket mapping."""
+
+    def test_adding_a_bucket_only_moves_keys_to_it(self):
+        """Test going from n to n + 1 buckets moves keys only onto bucket n."""
+        hashes = key_hashes(500)
+        buckets = [jump_back_hash(h, 1) for h in hashes]
+        assert buckets == [0] * len(hashes)
+
+        for n in range(1, 40):
+            grown = [jump_back_hash(h, n + 1) for h in hashes]
+            for before, after in zip(buckets, grown):
+                assert after == before or after == n
+            buckets = grown
+
+    def test_keys_spread_evenly(self):
+        """Test every bucket gets close to its fair share of keys."""
+        hashes = key_hashes(20000)
+        for num_buckets in (3, 10, 17):
+            counts = [0] * num_buckets
+            for h in hashes:
+                counts[jump_back_hash(h, num_buckets)] += 1
+
+            expected = len(hashes) / num_buckets
+            assert all(abs(c - expected) < 0.1 * expected for c in counts)
+
+    def test_num_buckets_must_be_positive(self):
+        """Test a non-positive bucket count is rejected."""
+        with pytest.raises(ValueError):
+            jump_back_hash(42, 0)
+        with pytest.raises(ValueError):
+            jump_back_hash(42, -1)
+
+
+class TestClusterConfigRoute:
+    """Test routing a key with a single hash."""
+
+    def test_route_matches_per_field_lookups(self):
+        """Test route() returns what the separate lookups return."""
+        for node_id in range(1, NUM_NODES + 1):
+            config = ClusterConfig(node_id)
+            for i in range(200):
+                key = f"key{i}"
+                route = config.route(key)
+
+                assert isinstance(route, KeyRoute)
+                assert route.shard == config.get_shard(key)
+                assert route.is_primary == config.is_primary_for_key(key)
+                assert route.primary_addr == config.get_node_address(config.get_primary_for_key(key))
+                assert route.replica_addr == config.get_node_address(config.get_replica_for_key(key))
+
+    def test_each_key_has_one_primary_and_a_distinct_replica(self):
+        """Test exactly one node is primary for a key, and its replica is another node."""
+        configs = [ClusterConfig(node_id) for node_id in range(1, NUM_NODES + 1)]
+        for i in range(200):
+            routes = [config.route(f"key{i}") for config in configs]
+
+            assert sum(route.is_primary for route in routes) == 1
+            assert routes[0].primary_addr != routes[0].replica_addr
+            # Nodes agree on everything but which of them is the primary
+            assert len({route._replace(is_primary=False) for route in routes}) == 1
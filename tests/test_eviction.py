@@ -11,7 +11,7 @@ Run with: python -m pytest tests/test_eviction.py -v
 
 import pytest
 from src.cache.store import KVStore
-from src.cache.eviction import LRUEvictionPolicy
+from src.cache.eviction import LRUEvictionPolicy, SampledLRUEvictionPolicy
 
 
 class TestLRUEvictionPolicy:
@@ -183,10 +183,66 @@ class TestLRUEvictionPolicy:
         # Access key1 to make it MRU
         lru_cache.get("key1")
 
-        keys = lru_cache.get_all_keys()
+        keys = list(lru_cache.get_all_keys())
 
         # Order should be: key2 (LRU), key3, key1 (MRU)
         assert keys == ["key2", "key3", "key1"]
+        assert lru_cache.get_all_keys_list() == keys
+
+    def test_get_all_keys_is_live_view(self, lru_cache: LRUEvictionPolicy):
+        """Test get_all_keys() reflects later changes without copying."""
+        keys = lru_cache.get_all_keys()
+        lru_cache.put("key1", "value1")
+
+        assert len(keys) == 1
+        assert "key1" in keys
+
+
+class TestSampledLRUEvictionPolicy:
+    """Test the sampled (approximate) LRU policy."""
+
+    def test_put_get_delete(self):
+        """Test basic operations."""
+        lru = SampledLRUEvictionPolicy(max_size=5)
+        lru.put("key1", "value1")
+        lru.put("key1", "value2")
+
+        assert lru.get("key1") == "value2"
+        assert lru.size() == 1
+        assert lru.delete("key1") is True
+        assert lru.delete("key1") is False
+        assert lru.get("key1") is None
+
+    def test_size_bounded_under_eviction(self):
+        """Test each put beyond max_size evicts exactly one key."""
+        lru = SampledLRUEvictionPolicy(max_size=50)
+        evicted = [lru.put(f"key{i}", i) for i in range(200)]
+
+        assert lru.size() == 50
+        assert sum(k is not None for k in evicted) == 150
+        assert lru.get("key199") == 199
+
+    def test_full_sample_evicts_true_lru(self):
+        """Test sampling every key (with repeats) finds the oldest often."""
+        lru = SampledLRUEvictionPolicy(max_size=2, sample_size=32)
+        lru.put("old", 1)
+        lru.put("new", 2)
+        lru.get("new")
+
+        assert lru.put("key", 3) == "old"
+
+    def test_delete_keeps_sampling_consistent(self):
+        """Test swap-removal keeps remaining keys reachable."""
+        lru = SampledLRUEvictionPolicy(max_size=10)
+        for i in range(10):
+            lru.put(f"key{i}", i)
+        for i in range(0, 10, 2):
+            lru.delete(f"key{i}")
+
+        evicted = [lru.evict_lru() for _ in range(5)]
+
+        assert sorted(k for k, _ in evicted) == [f"key{i}" for i in range(1, 10, 2)]
+        assert lru.evict_lru() is None
 
 
 class TestKVStoreEviction:
@@ -269,6 +325,24 @@ class TestKVStoreEviction:
         assert small_store.get("key4") is None  # Evicted
         assert small_store.get("key0") == "value0"  # MRU, still exists
 
+    def test_eviction_batch_on_large_store(self):
+        """Test large stores evict max_size // 128 LRU keys at once."""
+        store = KVStore(max_size=512)  # Batch of 4
+        for i in range(512):
+            store.put(f"key{i}", f"value{i}")
+
+        store.put("new0", "value")
+
+        # The 4 oldest keys go together, leaving room for 3 more puts
+        assert store.size() == 509
+        for i in range(4):
+            assert store.get(f"key{i}") is None
+        assert store.get("key4") == "value4"
+
+        for i in range(1, 4):
+            store.put(f"new{i}", "value")
+        assert store.size() == 512
+
 
 class TestEvictionEdgeCases:
     """Test edge cases for eviction."""
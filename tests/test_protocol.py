@@ -238,6 +238,58 @@ class TestParseRequestEdgeCases:
 
         assert cmd.type == CommandType.UNKNOWN
 
+    def test_parse_fast_path_matches_general_path(self, parser: ProtocolParser):
+        """Test uppercase commands parse the same as lowercase ones."""
+        for name, args in [("PUT", "key value"), ("GET", "key"), ("DELETE", "key"),
+                           ("EXISTS", "key"), ("REPL_DELETE", "key")]:
+            fast = parser.parse_request(f"{name} {args}\r\n")
+            general = parser.parse_request(f"{name.lower()} {args}\r\n")
+
+            assert fast.type == general.type != CommandType.UNKNOWN
+            assert (fast.key, fast.value, fast.ttl) == (general.key, general.value, general.ttl)
+            assert fast.raw == f"{name} {args}"
+
+
+class TestParseBatch:
+    """Test parse_batch method."""
+
+    def test_parse_batch_list(self, parser: ProtocolParser):
+        """Test batch parsing a list matches per-command parsing."""
+        raws = ["PUT key value 60", "GET key", "DELETE key", "EXISTS key", "BOGUS"]
+        cmds = parser.parse_batch(raws)
+
+        assert [c.type for c in cmds] == [
+            CommandType.PUT,
+            CommandType.GET,
+            CommandType.DELETE,
+            CommandType.EXISTS,
+            CommandType.UNKNOWN,
+        ]
+        assert cmds == [parser.parse_request(raw) for raw in raws]
+
+    def test_parse_batch_buffer(self, parser: ProtocolParser):
+        """Test batch parsing a newline-delimited buffer."""
+        cmds = parser.parse_batch("PUT a 1\r\nGET a\nQUIT\n")
+
+        assert [c.type for c in cmds] == [CommandType.PUT, CommandType.GET, CommandType.QUIT]
+        assert cmds[0].key == "a"
+        assert cmds[0].value == "1"
+
+    def test_parse_batch_buffer_splits_on_newline_only(self, parser: ProtocolParser):
+        """Test other line-boundary characters stay inside their request."""
+        cmds = parser.parse_batch("PUT a b\x1cc\nGET a\u2028b\nGET a")
+
+        assert cmds == [
+            parser.parse_request("PUT a b\x1cc"),
+            parser.parse_request("GET a\u2028b"),
+            parser.parse_request("GET a"),
+        ]
+
+    def test_parse_batch_empty(self, parser: ProtocolParser):
+        """Test batch parsing empty input."""
+        assert parser.parse_batch([]) == []
+        assert parser.parse_batch("") == []
+
 
 class TestFormatResponse:
     """Test format_response method."""
@@ -390,3 +442,27 @@ class TestResponseClass:
         resp = Response.exists_response(False)
         assert resp.status == ResponseStatus.OK
         assert resp.message == "0"
+
+    def test_encoded_responses_match_format(self, parser: ProtocolParser):
+        """Test precomputed wire bytes equal the formatted response."""
+        for resp in [
+            Response.stored(),
+            Response.deleted(),
+            Response.key_not_found(),
+            Response.exists_response(True),
+            Response.exists_response(False),
+            Response.value_response("myvalue"),
+        ]:
+            assert resp.encoded == parser.format_response(resp).encode()
+
+        assert Response.value_response("").encoded is None
+
+    def test_shared_fixed_responses(self):
+        """Test the module-level fixed responses match their factories."""
+        from src.protocol import commands
+
+        assert commands.STORED == Response.stored()
+        assert commands.DELETED == Response.deleted()
+        assert commands.KEY_NOT_FOUND == Response.key_not_found()
+        assert commands.EXISTS_TRUE == Response.exists_response(True)
+        assert commands.EXISTS_FALSE == Response.exists_response(False)
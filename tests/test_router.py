@@ -0,0 +1,106 @@
+"""
+Tests for the cluster router's peer connections
+
+These tests verify how ClusterRouter talks to other nodes:
+- Connections to a peer are pooled and reused
+- A pooled connection the peer closed is replaced once, before any answer
+- A batch the peer partly answered is never sent again
+
+Run with: python -m pytest tests/test_router.py -v
+"""
+
+import asyncio
+
+import pytest
+from src.cluster.config import ClusterConfig
+from src.cluster.router import ClusterRouter
+from src.protocol.commands import Command, CommandType
+
+
+class FakePeer:
+    """
+    Minimal node that records every line it reads.
+
+    hangups maps a connection number (from 1) to how many lines that
+    connection answers before the peer closes it without replying.
+    """
+
+    def __init__(self, hangups=None):
+        self.hangups = hangups or {}
+        self.received = []
+        self.connections = 0
+        self.server = None
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        answers_left = self.hangups.get(self.connections)
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            self.received.append(line)
+            if answers_left == 0:
+                break
+            if answers_left is not None:
+                answers_left -= 1
+            writer.write(b"OK stored\n")
+        writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return self.server.sockets[0].getsockname()
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def put(key: str) -> Command:
+    return Command(type=CommandType.PUT, key=key, value="v")
+
+
+@pytest.mark.asyncio
+class TestRouterConnections:
+    """Test connection pooling and the stale-connection retry."""
+
+    async def test_connection_is_reused(self):
+        """Test consecutive requests to a peer share one connection."""
+        peer = FakePeer()
+        address = await peer.start()
+        router = ClusterRouter(ClusterConfig(1))
+        try:
+            for key in ("a", "b", "c"):
+                response = await router.forward_to_primary(put(key), address)
+                assert response.message == "stored"
+            assert peer.connections == 1
+        finally:
+            await router.close()
+            await peer.stop()
+
+    async def test_closed_pooled_connection_is_replaced(self):
+        """Test a pooled connection dropped before answering is retried once."""
+        peer = FakePeer(hangups={1: 1})  # first connection answers one line
+        address = await peer.start()
+        router = ClusterRouter(ClusterConfig(1))
+        try:
+            assert (await router.forward_to_primary(put("a"), address)).message == "stored"
+            assert (await router.forward_to_primary(put("b"), address)).message == "stored"
+            assert peer.connections == 2
+        finally:
+            await router.close()
+            await peer.stop()
+
+    async def test_partly_answered_batch_is_not_resent(self):
+        """Test commands after a mid-batch close fail instead of being replayed."""
+        peer = FakePeer(hangups={1: 2})  # answers "a" and "b", then closes
+        address = await peer.start()
+        router = ClusterRouter(ClusterConfig(1))
+        try:
+            await router.forward_to_primary(put("a"), address)  # pools the connection
+            results = await router.replicate_batch([put("b"), put("c")], address)
+            assert results == [True, False]
+            assert peer.connections == 1
+            assert len(peer.received) == 3
+        finally:
+            await router.close()
+            await peer.stop()
@@ -11,7 +11,10 @@ Run with: python -m pytest tests/test_server.py -v
 """
 
 import asyncio
+import socket
+
 import pytest
+from src.network.tcp_server import KVServer
 from tests.conftest import AsyncClient
 
 
@@ -62,6 +65,68 @@ class TestServerConnection:
         writer.close()
         await writer.wait_closed()
 
+    async def test_server_handles_last_line_without_newline(self, server, server_port):
+        """Test a final command without a newline is still executed at EOF."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', server_port)
+
+        writer.write(b"PUT key value")
+        writer.write_eof()
+        await writer.drain()
+
+        response = await reader.readline()
+        assert response == b"OK stored\n"
+
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_server_answers_pipelined_commands_in_order(self, server, server_port):
+        """Test pipelined commands, including ones before QUIT, are all answered in order."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', server_port)
+
+        writer.write(b"PUT key value\nGET \xff\nGET key\nBOGUS\nEXISTS key\nQUIT\n")
+        await writer.drain()
+
+        response = await asyncio.wait_for(reader.read(), timeout=2)
+        assert response == (
+            b"OK stored\n"
+            b"ERROR invalid encoding\n"
+            b"OK value\n"
+            b"ERROR invalid command\n"
+            b"OK 1\n"
+        )
+
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_server_answers_pipeline_before_oversized_line(self, server, server_port):
+        """Test a line over the read limit is rejected without losing the pipeline around it."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', server_port)
+
+        writer.write(b"PUT a 1\nEXISTS a\nPUT b " + b"v" * 100_000 + b"\nGET a\nQUIT\n")
+        await writer.drain()
+
+        response = await asyncio.wait_for(reader.read(), timeout=2)
+        assert response == b"OK stored\nOK 1\nERROR invalid command\nOK 1\n"
+
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_server_handles_pipeline_larger_than_buffers(self, server, server_port):
+        """Test a pipeline spanning many socket reads and write batches."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', server_port)
+        count = 5000
+
+        writer.write(b"".join(f"PUT key{i} {'v' * 50}\n".encode() for i in range(count)))
+        writer.write(f"GET key{count - 1}\n".encode())
+        await writer.drain()
+
+        lines = [await asyncio.wait_for(reader.readline(), timeout=5) for _ in range(count + 1)]
+        assert lines[:count] == [b"OK stored\n"] * count
+        assert lines[count] == f"OK {'v' * 50}\n".encode()
+
+        writer.close()
+        await writer.wait_closed()
+
 
 @pytest.mark.asyncio
 class TestServerCommands:
@@ -243,3 +308,24 @@ class TestServerEdgeCases:
             for i, key in enumerate(keys):
                 response = await client.send_command(f"GET {key}")
                 assert response == f"OK value{i}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="needs SO_REUSEPORT")
+class TestServerReusePort:
+    """Test several servers sharing one port (multi-process workers)."""
+
+    async def test_two_servers_share_port(self, server_port):
+        """Test reuse_port lets a second server bind the same port."""
+        servers = [KVServer(host='127.0.0.1', port=server_port, reuse_port=True) for _ in range(2)]
+        tasks = [asyncio.create_task(srv.start()) for srv in servers]
+        await asyncio.sleep(0.1)
+
+        try:
+            assert all(srv.is_running() for srv in servers)
+            async with AsyncClient('127.0.0.1', server_port) as client:
+                assert await client.send_command("PUT key value") == "OK stored"
+        finally:
+            for srv in servers:
+                await srv.stop()
+            await asyncio.gather(*tasks, return_exceptions=True)
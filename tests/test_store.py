@@ -11,7 +11,8 @@ Run with: python -m pytest tests/test_store.py -v
 """
 
 import pytest
-from src.cache.store import KVStore
+from src.cache.sharded import ShardedKVStore
+from src.cache.store import KVStore, NoTTLKVStore
 
 
 class TestKVStorePut:
@@ -108,6 +109,14 @@ class TestKVStoreDelete:
         result = store.delete("nonexistent")
         assert result is False
 
+    def test_delete_stored_none_value(self):
+        """Test a key whose stored value is None still counts as existing."""
+        for store in (KVStore(max_size=10), NoTTLKVStore(max_size=10)):
+            store.put("key", None)
+
+            assert store.delete("key") is True
+            assert store.delete("key") is False
+
     def test_delete_then_get(self, store: KVStore):
         """Test that get returns None after delete."""
         store.put("key", "value")
@@ -214,9 +223,136 @@ class TestKVStoreSizeAndClear:
         assert store.size() == 0
 
 
+class TestKVStoreBulk:
+    """Test put_many() and get_many() methods."""
+
+    def test_put_many(self, store: KVStore):
+        """Test storing several pairs at once."""
+        count = store.put_many(["k1", "k2", "k3"], ["v1", "v2", "v3"])
+
+        assert count == 3
+        assert store.size() == 3
+        assert store.get("k2") == "v2"
+
+    def test_put_many_updates_existing(self, store: KVStore):
+        """Test put_many overwrites existing keys without growing."""
+        store.put("k1", "old")
+        store.put_many(["k1", "k2"], ["new", "v2"])
+
+        assert store.get("k1") == "new"
+        assert store.size() == 2
+
+    def test_put_many_evicts_lru(self, small_store: KVStore):
+        """Test put_many respects max_size with LRU eviction."""
+        small_store.put_many([f"key{i}" for i in range(7)], [f"value{i}" for i in range(7)])
+
+        assert small_store.size() == 5
+        assert small_store.get("key0") is None
+        assert small_store.get("key1") is None
+        assert small_store.get("key6") == "value6"
+
+    def test_get_many(self, store: KVStore):
+        """Test retrieving several keys at once, including misses."""
+        store.put_many(["a", "b"], ["1", "2"])
+
+        assert store.get_many(["a", "missing", "b"]) == ["1", None, "2"]
+        assert store.get_many([]) == []
+
+    def test_get_many_updates_lru(self, small_store: KVStore):
+        """Test get_many marks keys as recently used."""
+        small_store.put_many([f"key{i}" for i in range(5)], [f"value{i}" for i in range(5)])
+        small_store.get_many(["key0"])
+        small_store.put("key5", "value5")
+
+        assert small_store.exists("key0") is True
+        assert small_store.exists("key1") is False
+
+
+class TestShardedKVStore:
+    """Test the hash-sharded store wrapper."""
+
+    def test_basic_operations(self):
+        """Test put/get/exists/delete route to the owning shard."""
+        store = ShardedKVStore(max_size=1000, shards=8)
+        for i in range(100):
+            store.put(f"key{i}", f"value{i}")
+
+        assert store.size() == 100
+        assert store.get("key42") == "value42"
+        assert store.exists("key7") is True
+        assert store.delete("key7") is True
+        assert store.exists("key7") is False
+        assert store.get_many(["key1", "key7"]) == ["value1", None]
+        assert store.get_stats()["total_keys"] == 99
+
+        store.clear()
+        assert store.size() == 0
+
+    def test_max_size_enforced_per_shard(self):
+        """Test total size stays within max_size under eviction."""
+        store = ShardedKVStore(max_size=64, shards=4)
+        for i in range(1000):
+            store.put(f"key{i}", f"value{i}")
+
+        assert store.size() <= 64
+        assert store.get("key999") == "value999"
+
+    def test_max_size_not_exceeded_when_uneven(self):
+        """Test the total limit holds when max_size doesn't divide evenly."""
+        for max_size, shards in ((5, 16), (1000, 16), (1, 4)):
+            store = ShardedKVStore(max_size=max_size, shards=shards)
+            for i in range(5000):
+                store.put(f"key{i}", f"value{i}")
+
+            assert store.size() <= max_size
+            assert sum(s.max_size for s in store._shards) == max_size
+
+    def test_store_class_used_for_shards(self):
+        """Test shards are built from the given store class."""
+        store = ShardedKVStore(max_size=64, shards=4, store_class=NoTTLKVStore)
+        store.put("key", "value", ttl=1)  # ttl is ignored
+
+        assert all(type(s) is NoTTLKVStore for s in store._shards)
+        assert store.get("key") == "value"
+
+    def test_shards_must_be_power_of_two(self):
+        """Test invalid shard counts are rejected."""
+        with pytest.raises(ValueError):
+            ShardedKVStore(max_size=10, shards=3)
+        with pytest.raises(ValueError):
+            ShardedKVStore(max_size=10, shards=0)
+
+
+class TestNoTTLKVStore:
+    """Test the TTL-less store variant."""
+
+    def test_basic_operations(self):
+        """Test put/get/exists/delete and LRU eviction without TTL bookkeeping."""
+        store = NoTTLKVStore(max_size=3)
+        store.put("key1", "value1")
+        store.put("key2", "value2", ttl=1)  # ttl is ignored
+        store.put("key3", "value3")
+        store.get("key1")
+        store.put("key4", "value4")
+
+        assert store.exists("key2") is False  # LRU evicted, not expired
+        assert store.get("key1") == "value1"
+        assert store.delete("key3") is True
+        assert store.delete("key3") is False
+        assert store.get_many(["key1", "key4"]) == ["value1", "value4"]
+        assert store._expiries == {}
+        assert store.cleanup_expired() == 0
+
+
 class TestKVStoreEdgeCases:
     """Test edge cases."""
 
+    def test_bytes_value_returned_as_is(self, store: KVStore):
+        """Test values are stored without conversion (bytes stay bytes)."""
+        value = b"payload"
+        store.put("key", value)
+        assert store.get("key") is value
+
     def test_empty_key(self, store: KVStore):
         """Test empty string as key."""
         result = store.put("", "value")
@@ -146,6 +146,20 @@ class TestTTLMultipleKeys:
         assert store.get("no_ttl") == "value2"
 
 
+    @pytest.mark.slow
+    def test_bulk_put_and_get_with_ttl(self, store: KVStore):
+        """Test put_many TTL applies to every key and get_many expires them."""
+        store.put_many(["k1", "k2"], ["v1", "v2"], ttl=1)
+        store.put("k3", "v3")
+
+        assert store.get_many(["k1", "k2", "k3"]) == ["v1", "v2", "v3"]
+
+        time.sleep(1.1)
+
+        assert store.get_many(["k1", "k2", "k3"]) == [None, None, "v3"]
+        assert store.size() == 1
+
+
 class TestTTLLazyCleanup:
     """Test lazy cleanup of expired keys."""
 
@@ -209,6 +223,26 @@ class TestTTLActiveCleanup:
         assert removed == 0
         assert store.size() == 2
 
+    @pytest.mark.slow
+    def test_cleanup_skips_updated_and_deleted_keys(self, store: KVStore):
+        """Test cleanup ignores old deadlines of keys changed since."""
+        store.put("extended", "value", ttl=1)
+        store.put("extended", "value", ttl=60)  # New deadline replaces old
+        store.put("cleared", "value", ttl=1)
+        store.put("cleared", "value")  # TTL removed
+        store.put("deleted", "value", ttl=1)
+        store.delete("deleted")
+        store.put("expiring", "value", ttl=1)
+
+        time.sleep(1.1)
+
+        removed = store.cleanup_expired()
+
+        assert removed == 1
+        assert store.get("extended") == "value"
+        assert store.get("cleared") == "value"
+        assert store.get("expiring") is None
+
 
 class TestTTLStats:
     """Test TTL with stats."""